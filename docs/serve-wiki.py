@@ -3,13 +3,83 @@
 Simple HTTP server to serve the Servin Container Runtime wiki
 """
 
+import email.utils
+import gzip
+import hashlib
 import http.server
-import socketserver
+import mimetypes
+import signal
 import webbrowser
 import os
 import sys
+import urllib.parse
 from pathlib import Path
 
+# Resolve the JS content type once instead of via mimetypes on every request
+http.server.SimpleHTTPRequestHandler.extensions_map[".js"] = "application/javascript; charset=utf-8"
+
+class CachedWikiHandler(http.server.SimpleHTTPRequestHandler):
+    """Serve wiki files from an in-memory cache with gzip and conditional GETs"""
+    
+    # URL path -> (raw, gzipped, content_type, mtime, etag)
+    _cache = {}
+    
+    @classmethod
+    def build_cache(cls, root):
+        """Read and compress every file under root once"""
+        cache = {}
+        for path in Path(root).rglob("*"):
+            if not path.is_file():
+                continue
+            raw = path.read_bytes()
+            url_path = "/" + path.relative_to(root).as_posix()
+            content_type = (cls.extensions_map.get(path.suffix.lower())
+                            or mimetypes.guess_type(path.name)[0]
+                            or "application/octet-stream")
+            etag = '"%s"' % hashlib.sha1(raw).hexdigest()
+            cache[url_path] = (raw, gzip.compress(raw, compresslevel=6), content_type, path.stat().st_mtime, etag)
+        # Swap the whole dict at once so in-flight requests see a consistent cache
+        cls._cache = cache
+    
+    def do_GET(self):
+        url_path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        entry = self._cache.get(url_path)
+        if entry is None:
+            return super().do_GET()
+        
+        raw, gz, content_type, mtime, etag = entry
+        if self._not_modified(etag, mtime):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        
+        use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        body = gz if use_gzip else raw
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _not_modified(self, etag, mtime):
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since
+        return False
+
 def main():
     # Configuration
     PORT = 8081
@@ -26,10 +96,17 @@ def main():
         sys.exit(1)
     
     # Create HTTP server
-    handler = http.server.SimpleHTTPRequestHandler
+    handler = CachedWikiHandler
+    handler.build_cache(WIKI_DIR)
+    
+    # Pick up edited wiki files without restarting the server
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda signum, frame: handler.build_cache(WIKI_DIR))
     
     try:
-        with socketserver.TCPServer(("", PORT), handler) as httpd:
+        # Serve the page's subresources concurrently rather than one at a time
+        with http.server.ThreadingHTTPServer(("", PORT), handler) as httpd:
+            httpd.daemon_threads = True
             print("🚀 Servin Container Runtime Wiki Server")
             print("=" * 50)
             print(f"📚 Serving wiki at: http://localhost:{PORT}/{WIKI_FILE}")
@@ -0,0 +1,78 @@
+#!/bin/bash
+
+# Servin Container Runtime - User Installer zipapp Builder
+# Packages servin-user-installer.py as a single-file .pyz that ships only
+# precompiled bytecode, so launching the wizard skips the source compile step.
+#
+# The .pyc files are tied to the bytecode version of $PYTHON: build with the
+# same python3 minor version the target systems run. The servin binaries and
+# icons are still looked up next to the .pyz, not inside it.
+
+set -euo pipefail
+
+# Configuration
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BUILD_DIR="$SCRIPT_DIR/build"
+STAGE_DIR="$BUILD_DIR/user-installer-pyz"
+OUTPUT="$BUILD_DIR/servin-user-installer.pyz"
+PYTHON="${PYTHON:-python3}"
+
+# Color output functions
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+BLUE='\033[0;34m'
+NC='\033[0m'
+
+print_success() { echo -e "${GREEN}✓ $1${NC}"; }
+print_error() { echo -e "${RED}✗ $1${NC}"; }
+print_info() { echo -e "${BLUE}→ $1${NC}"; }
+
+if ! command -v "$PYTHON" >/dev/null 2>&1; then
+    print_error "$PYTHON not found"
+    exit 1
+fi
+
+# Stage the installer under an importable module name with a __main__ entry point
+print_info "Staging installer sources in $STAGE_DIR"
+rm -rf "$STAGE_DIR"
+mkdir -p "$STAGE_DIR"
+cp "$SCRIPT_DIR/servin-user-installer.py" "$STAGE_DIR/servin_user_installer.py"
+cat > "$STAGE_DIR/__main__.py" << 'EOF'
+from servin_user_installer import ServinLinuxInstaller
+
+installer = ServinLinuxInstaller()
+installer.root.mainloop()
+EOF
+
+# Compile next to the sources (-b) so zipimport finds the sourceless .pyc files
+print_info "Precompiling bytecode with $("$PYTHON" --version 2>&1)"
+"$PYTHON" -m compileall -q -b "$STAGE_DIR"
+
+print_info "Building $OUTPUT"
+"$PYTHON" -m zipapp "$STAGE_DIR" -o "$OUTPUT" -p "/usr/bin/env python3"
+
+# zipapp insists on __main__.py being present, so strip the .py sources afterwards
+"$PYTHON" - "$OUTPUT" << 'EOF'
+import os
+import sys
+import zipfile
+
+archive = sys.argv[1]
+stripped = archive + ".tmp"
+
+with open(archive, "rb") as f:
+    shebang = f.readline()
+
+with zipfile.ZipFile(archive) as src, open(stripped, "wb") as f:
+    f.write(shebang)
+    with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            if not info.filename.endswith(".py"):
+                dst.writestr(info, src.read(info))
+
+os.chmod(stripped, 0o755)
+os.replace(stripped, archive)
+EOF
+
+rm -rf "$STAGE_DIR"
+print_success "User installer zipapp created: $OUTPUT"
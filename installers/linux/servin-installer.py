@@ -4,18 +4,70 @@ Servin Container Runtime - Linux Installation Wizard
 A graphical installer for Linux systems using tkinter
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+import asyncio
 import os
 import sys
+
+try:
+    import tkinter as tk
+    from tkinter import ttk, messagebox, filedialog
+except ImportError:
+    print("Error: tkinter is not available. Please install it:")
+    print("Ubuntu/Debian: sudo apt-get install python3-tk")
+    print("CentOS/RHEL: sudo yum install tkinter")
+    print("Or use the command-line installer: sudo ./install.sh")
+    sys.exit(1)
+
 import subprocess
 import pwd
 import grp
+import queue
+import shlex
 import shutil
-import tempfile
-import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+PROTECTED_DIRS = {"/", "/bin", "/boot", "/dev", "/etc", "/home", "/lib", "/lib64", "/opt",
+                  "/proc", "/root", "/sbin", "/sys", "/usr", "/usr/bin", "/usr/lib",
+                  "/usr/local", "/usr/local/bin", "/var", "/var/lib", "/var/log"}
+
+LICENSE_TEXT = """Apache License 2.0
+
+Copyright 2025 Servin Project
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+This software is provided "AS IS" without warranty of any kind."""
+
+SUMMARY_TEMPLATE = """Installation Directory: {install_dir}
+Data Directory: {data_dir}
+Configuration Directory: {config_dir}
+
+Components to install:
+• Core Runtime: Yes
+• Desktop GUI: {install_gui}
+• System Service: {install_service}
+• Desktop Shortcuts: {create_shortcuts}
+
+Advanced Options:
+• Create system user: {create_user}
+• Add to PATH: {add_to_path}
+
+Click 'Install' to begin the installation process."""
+
 class ServinInstaller:
     def __init__(self):
         self.root = tk.Tk()
@@ -30,13 +82,28 @@ class ServinInstaller:
         self.install_gui = tk.BooleanVar(value=True)
         self.install_service = tk.BooleanVar(value=True)
         self.create_shortcuts = tk.BooleanVar(value=True)
+        self.create_user = tk.BooleanVar(value=True)
+        self.add_to_path = tk.BooleanVar(value=True)
+        self.accept_license = tk.BooleanVar()
+        self.launch_gui = tk.BooleanVar(value=True)
+        self.start_service = tk.BooleanVar(value=True)
+        
+        # Shared by always-on, disabled checkboxes such as the core runtime
+        self._const_true = tk.BooleanVar(value=True)
         
         # Check if running as root
         self.is_root = os.geteuid() == 0
         
-        # Current page
+        # Current page; pages are only built when first shown (see show_page)
         self.current_page = 0
         self.pages = []
+        self._page_cache = {}
+        
+        # (uid, gid) of the servin account, looked up once via NSS
+        self._servin_ids = None
+        
+        # Messages from the installation worker thread, drained on the Tk thread
+        self._queue = queue.Queue()
         
         self.setup_ui()
         self.show_page(0)
@@ -88,6 +155,15 @@ class ServinInstaller:
             self.create_installation_page,
             self.create_finish_page
         ]
+        
+        # Next button options per page, applied in a single configure call
+        last_page = len(self.pages) - 1
+        self._next_button_config = {
+            page_num: {"text": "Next >", "command": self.go_next, "state": tk.NORMAL}
+            for page_num in range(len(self.pages))
+        }
+        self._next_button_config[last_page - 1].update(text="Install", command=self.start_installation)
+        self._next_button_config[last_page].update(text="Finish", command=self.finish_install)
     
     def create_welcome_page(self):
         page = ttk.Frame(self.content_frame)
@@ -147,36 +223,20 @@ Click Next to continue."""
         text_frame = ttk.Frame(page)
         text_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         
-        text_widget = tk.Text(text_frame, height=15, width=70, wrap=tk.WORD)
-        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
-        text_widget.configure(yscrollcommand=scrollbar.set)
-        
-        license_text = """Apache License 2.0
-
-Copyright 2025 Servin Project
-
-Licensed under the Apache License, Version 2.0 (the "License");
-you may not use this file except in compliance with the License.
-You may obtain a copy of the License at
-
-    http://www.apache.org/licenses/LICENSE-2.0
-
-Unless required by applicable law or agreed to in writing, software
-distributed under the License is distributed on an "AS IS" BASIS,
-WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-See the License for the specific language governing permissions and
-limitations under the License.
-
-This software is provided "AS IS" without warranty of any kind."""
+        # The license is read-only, so lay it out once as a label on a
+        # scrollable canvas rather than inserting it into a word-wrapped Text
+        canvas = tk.Canvas(text_frame, height=240, width=560, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
         
-        text_widget.insert(tk.END, license_text)
-        text_widget.configure(state=tk.DISABLED)
+        license_label = ttk.Label(canvas, text=LICENSE_TEXT, wraplength=540, justify=tk.LEFT)
+        canvas.create_window((0, 0), window=license_label, anchor=tk.NW)
+        license_label.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox(tk.ALL)))
         
-        text_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
         # Accept checkbox
-        self.accept_license = tk.BooleanVar()
         accept_check = ttk.Checkbutton(page, text="I accept the terms of the License Agreement", 
                                       variable=self.accept_license, command=self.update_next_button)
         accept_check.grid(row=2, column=0, sticky=tk.W, pady=10)
@@ -192,7 +252,7 @@ This software is provided "AS IS" without warranty of any kind."""
         options_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         
         ttk.Checkbutton(options_frame, text="Core Runtime (required)", 
-                       state=tk.DISABLED, variable=tk.BooleanVar(value=True)).grid(row=0, column=0, sticky=tk.W, pady=2)
+                       state=tk.DISABLED, variable=self._const_true).grid(row=0, column=0, sticky=tk.W, pady=2)
         
         ttk.Checkbutton(options_frame, text="Desktop GUI Application", 
                        variable=self.install_gui).grid(row=1, column=0, sticky=tk.W, pady=2)
@@ -207,11 +267,9 @@ This software is provided "AS IS" without warranty of any kind."""
         advanced_frame = ttk.LabelFrame(page, text="Advanced Options", padding="10")
         advanced_frame.grid(row=2, column=0, sticky=(tk.W, tk.E))
         
-        self.create_user = tk.BooleanVar(value=True)
         ttk.Checkbutton(advanced_frame, text="Create 'servin' system user", 
                        variable=self.create_user).grid(row=0, column=0, sticky=tk.W, pady=2)
         
-        self.add_to_path = tk.BooleanVar(value=True)
         ttk.Checkbutton(advanced_frame, text="Add to system PATH", 
                        variable=self.add_to_path).grid(row=1, column=0, sticky=tk.W, pady=2)
         
@@ -310,9 +368,6 @@ This software is provided "AS IS" without warranty of any kind."""
         launch_frame = ttk.LabelFrame(page, text="What would you like to do next?", padding="10")
         launch_frame.grid(row=2, column=0, sticky=(tk.W, tk.E))
         
-        self.launch_gui = tk.BooleanVar(value=True)
-        self.start_service = tk.BooleanVar(value=True)
-        
         ttk.Checkbutton(launch_frame, text="Launch Servin GUI", variable=self.launch_gui).grid(row=0, column=0, sticky=tk.W, pady=2)
         ttk.Checkbutton(launch_frame, text="Start Servin service", variable=self.start_service).grid(row=1, column=0, sticky=tk.W, pady=2)
         
@@ -328,27 +383,24 @@ This software is provided "AS IS" without warranty of any kind."""
             self.next_button.configure(state=tk.NORMAL if self.accept_license.get() else tk.DISABLED)
     
     def show_page(self, page_num):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        # Hide the current page; built pages are kept and reused on revisit
+        for frame in self._page_cache.values():
+            frame.grid_remove()
         
-        # Create and show new page
-        page = self.pages[page_num]()
-        page.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        if page_num not in self._page_cache:
+            self._page_cache[page_num] = self.pages[page_num]()
+        self._page_cache[page_num].grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Update buttons
         self.back_button.configure(state=tk.NORMAL if page_num > 0 else tk.DISABLED)
         
-        if page_num == len(self.pages) - 1:  # Last page
-            self.next_button.configure(text="Finish", command=self.finish_install)
-        elif page_num == len(self.pages) - 2:  # Installation page
-            self.next_button.configure(text="Install", command=self.start_installation)
-        else:
-            self.next_button.configure(text="Next >", command=self.go_next)
+        next_config = self._next_button_config[page_num]
         
         # Special handling for license page
         if page_num == 1:
-            self.next_button.configure(state=tk.DISABLED)
+            next_config = dict(next_config, state=tk.NORMAL if self.accept_license.get() else tk.DISABLED)
+        
+        self.next_button.configure(**next_config)
         
         # Update confirmation page with summary
         if page_num == 4:  # Confirmation page
@@ -357,22 +409,19 @@ This software is provided "AS IS" without warranty of any kind."""
         self.current_page = page_num
     
     def update_summary(self):
-        summary = f"""Installation Directory: {self.install_dir.get()}
-Data Directory: {self.data_dir.get()}
-Configuration Directory: {self.config_dir.get()}
-
-Components to install:
-• Core Runtime: Yes
-• Desktop GUI: {'Yes' if self.install_gui.get() else 'No'}
-• System Service: {'Yes' if self.install_service.get() else 'No'}
-• Desktop Shortcuts: {'Yes' if self.create_shortcuts.get() else 'No'}
-
-Advanced Options:
-• Create system user: {'Yes' if self.create_user.get() else 'No'}
-• Add to PATH: {'Yes' if self.add_to_path.get() else 'No'}
-
-Click 'Install' to begin the installation process."""
-        
+        yes_no = lambda var: 'Yes' if var.get() else 'No'
+        summary = SUMMARY_TEMPLATE.format_map({
+            "install_dir": self.install_dir.get(),
+            "data_dir": self.data_dir.get(),
+            "config_dir": self.config_dir.get(),
+            "install_gui": yes_no(self.install_gui),
+            "install_service": yes_no(self.install_service),
+            "create_shortcuts": yes_no(self.create_shortcuts),
+            "create_user": yes_no(self.create_user),
+            "add_to_path": yes_no(self.add_to_path),
+        })
+        
+        self.summary_text.configure(state=tk.NORMAL)
         self.summary_text.delete(1.0, tk.END)
         self.summary_text.insert(tk.END, summary)
         self.summary_text.configure(state=tk.DISABLED)
@@ -394,123 +443,260 @@ Click 'Install' to begin the installation process."""
             messagebox.showerror("Error", "Root privileges are required for installation.\nPlease run: sudo python3 servin-installer.py")
             return
         
+        # Snapshot the options on the Tk thread; the worker never touches Tk variables
+        try:
+            install_dir = self.validate_directory("Installation directory", self.install_dir.get())
+            data_dir = self.validate_directory("Data directory", self.data_dir.get())
+            config_dir = self.validate_directory("Configuration directory", self.config_dir.get())
+        except ValueError as e:
+            messagebox.showerror("Invalid Directory", str(e))
+            return
+        
+        # data_dir is handed to chown -R, so never let it be a system tree
+        if data_dir in PROTECTED_DIRS:
+            messagebox.showerror("Invalid Directory", f"Data directory cannot be {data_dir}")
+            return
+        
+        options = {
+            "install_dir": install_dir,
+            "data_dir": data_dir,
+            "config_dir": config_dir,
+            "install_gui": self.install_gui.get(),
+            "install_service": self.install_service.get(),
+            "create_user": self.create_user.get(),
+        }
+        
         self.show_page(len(self.pages) - 2)  # Installation page
         self.next_button.configure(state=tk.DISABLED)
         self.back_button.configure(state=tk.DISABLED)
         
-        # Start installation in background
-        self.root.after(100, self.perform_installation)
+        # Start installation in background so the UI stays responsive
+        threading.Thread(target=self._install_worker, args=(options,), daemon=True).start()
+        self.root.after(50, self._poll_queue)
+    
+    def validate_directory(self, label, value):
+        """Return value as a normalized absolute path, rejecting traversal"""
+        path = Path(value)
+        if not value or not path.is_absolute():
+            raise ValueError(f"{label} must be an absolute path: {value!r}")
+        if ".." in path.parts:
+            raise ValueError(f"{label} must not contain '..': {value}")
+        return str(path.resolve(strict=False))
     
     def log_message(self, message):
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+        self._queue.put(("log", message))
     
-    def perform_installation(self):
-        try:
-            self.progress['value'] = 0
-            self.status_label.configure(text="Creating directories...")
-            self.log_message("Starting installation...")
-            
-            # Create directories
-            directories = [
-                self.install_dir.get(),
-                self.data_dir.get(),
-                self.config_dir.get(),
-                f"{self.data_dir.get()}/volumes",
-                f"{self.data_dir.get()}/images",
-                "/var/log/servin"
-            ]
-            
-            for directory in directories:
-                os.makedirs(directory, exist_ok=True)
-                self.log_message(f"Created directory: {directory}")
-            
-            self.progress['value'] = 20
-            
-            # Install binaries (assuming they're in the same directory as this script)
-            self.status_label.configure(text="Installing binaries...")
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            binaries = ["servin", "servin-tui"]
-            if self.install_gui.get():
-                binaries.append("servin-gui")
-            
-            for binary in binaries:
-                src = os.path.join(script_dir, binary)
-                dst = os.path.join(self.install_dir.get(), binary)
-                if os.path.exists(src):
-                    shutil.copy2(src, dst)
-                    os.chmod(dst, 0o755)
-                    self.log_message(f"Installed: {binary}")
-                else:
-                    self.log_message(f"Warning: {binary} not found")
-            
-            self.progress['value'] = 40
+    def set_status(self, text):
+        self._queue.put(("status", text))
+    
+    def set_progress(self, value):
+        self._queue.put(("progress", value))
+    
+    def _poll_queue(self):
+        """Apply updates posted by the installation worker (Tk thread only)"""
+        # Coalesce every pending log line into one insert and one scroll
+        log_lines = []
+        finished = None
+        while finished is None:
+            try:
+                kind, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
             
-            # Create configuration
-            self.status_label.configure(text="Creating configuration...")
-            config_content = f"""# Servin Configuration File
-data_dir={self.data_dir.get()}
+            if kind == "log":
+                log_lines.append(value)
+            elif kind == "status":
+                self.status_label.configure(text=value)
+            elif kind == "progress":
+                self.progress['value'] = value
+            elif kind in ("done", "error"):
+                finished = (kind, value)
+        
+        if log_lines:
+            self.log_text.insert(tk.END, "\n".join(log_lines) + "\n")
+            self.log_text.see(tk.END)
+        
+        if finished is None:
+            self.root.after(50, self._poll_queue)
+        elif finished[0] == "done":
+            # Enable next button to go to finish page
+            self.next_button.configure(state=tk.NORMAL, text="Next >", command=self.go_next)
+        else:
+            messagebox.showerror("Installation Error", f"Installation failed: {finished[1]}")
+    
+    def _install_worker(self, options):
+        # The worker thread owns its own event loop so subprocesses can overlap
+        try:
+            asyncio.run(self.perform_installation(**options))
+        except Exception as e:
+            self.log_message(f"Error: {str(e)}")
+            self._queue.put(("error", str(e)))
+        else:
+            self._queue.put(("done", True))
+    
+    async def perform_installation(self, install_dir, data_dir, config_dir,
+                                   install_gui, install_service, create_user):
+        """Run the installation steps; called on the worker thread"""
+        self.set_progress(0)
+        self.set_status("Creating directories...")
+        self.log_message("Starting installation...")
+        
+        # Create directories
+        directories = [
+            install_dir,
+            data_dir,
+            config_dir,
+            f"{data_dir}/volumes",
+            f"{data_dir}/images",
+            "/var/log/servin"
+        ]
+        
+        # Parents are created along with their children, so only the deepest
+        # unique paths need a makedirs walk
+        unique = list(dict.fromkeys(os.path.normpath(d) for d in directories))
+        leaves = [d for d in unique
+                  if not any(other.startswith(d.rstrip(os.sep) + os.sep) for other in unique)]
+        for directory in leaves:
+            os.makedirs(directory, exist_ok=True)
+        self.log_message(f"Created {len(unique)} directories: {', '.join(unique)}")
+        
+        self.set_progress(20)
+        
+        # Install binaries (assuming they're in the same directory as this script)
+        self.set_status("Installing binaries...")
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        
+        binaries = ["servin", "servin-tui"]
+        if install_gui:
+            binaries.append("servin-gui")
+        
+        # The copies are independent, so overlap their I/O
+        with ThreadPoolExecutor(max_workers=len(binaries)) as executor:
+            futures = [executor.submit(self.install_binary, script_dir, install_dir, binary)
+                       for binary in binaries]
+            for future in as_completed(futures):
+                self.log_message(future.result())
+        
+        self.set_progress(40)
+        
+        # Configuration, the system user and the service unit don't depend on
+        # each other, so run them concurrently
+        self.set_status("Configuring system...")
+        steps = [self.create_configuration(data_dir, config_dir)]
+        if create_user:
+            steps.append(self.create_system_user())
+        if install_service:
+            steps.append(self.install_systemd_service(install_dir, config_dir))
+        await asyncio.gather(*steps)
+        
+        self.set_progress(80)
+        
+        # Set permissions
+        self.set_status("Setting permissions...")
+        if create_user:
+            try:
+                uid, gid = self.servin_ids()
+                for path in [data_dir, "/var/log/servin"]:
+                    self.chown_tree(path, uid, gid)
+                self.log_message("Set directory permissions")
+            except:
+                self.log_message("Warning: Could not set all permissions")
+        
+        self.set_progress(100)
+        self.set_status("Installation complete!")
+        self.log_message("Installation completed successfully!")
+    
+    async def create_configuration(self, data_dir, config_dir):
+        config_content = f"""# Servin Configuration File
+data_dir={data_dir}
 log_level=info
 log_file=/var/log/servin/servin.log
 runtime=native
 bridge_name=servin0
 cri_port=10250
 cri_enabled=false"""
-            
-            with open(f"{self.config_dir.get()}/servin.conf", 'w') as f:
-                f.write(config_content)
-            self.log_message("Created configuration file")
-            
-            self.progress['value'] = 60
-            
-            # Create user
-            if self.create_user.get():
-                self.status_label.configure(text="Creating system user...")
-                try:
-                    subprocess.run(["useradd", "--system", "--no-create-home", "--shell", "/bin/false", "servin"], 
-                                 check=False, capture_output=True)
-                    self.log_message("Created system user: servin")
-                except:
-                    self.log_message("User 'servin' may already exist")
-            
-            self.progress['value'] = 80
-            
-            # Install service
-            if self.install_service.get():
-                self.status_label.configure(text="Installing service...")
-                self.install_systemd_service()
-            
-            # Set permissions
-            self.status_label.configure(text="Setting permissions...")
-            if self.create_user.get():
-                try:
-                    uid = pwd.getpwnam("servin").pw_uid
-                    gid = grp.getgrnam("servin").gr_gid
-                    for path in [self.data_dir.get(), "/var/log/servin"]:
-                        os.chown(path, uid, gid)
-                        for root, dirs, files in os.walk(path):
-                            for d in dirs:
-                                os.chown(os.path.join(root, d), uid, gid)
-                            for f in files:
-                                os.chown(os.path.join(root, f), uid, gid)
-                    self.log_message("Set directory permissions")
-                except:
-                    self.log_message("Warning: Could not set all permissions")
-            
-            self.progress['value'] = 100
-            self.status_label.configure(text="Installation complete!")
-            self.log_message("Installation completed successfully!")
-            
-            # Enable next button to go to finish page
-            self.next_button.configure(state=tk.NORMAL, text="Next >", command=self.go_next)
-            
-        except Exception as e:
-            self.log_message(f"Error: {str(e)}")
-            messagebox.showerror("Installation Error", f"Installation failed: {str(e)}")
+        
+        self.write_file(f"{config_dir}/servin.conf", config_content)
+        self.log_message("Created configuration file")
+    
+    async def create_system_user(self):
+        try:
+            returncode = await self.run_command("useradd", "--system", "--no-create-home",
+                                                "--shell", "/bin/false", "servin")
+        except OSError:
+            returncode = None
+        if returncode == 0:
+            self.log_message("Created system user: servin")
+        else:
+            self.log_message("User 'servin' may already exist")
+    
+    async def run_command(self, *args):
+        """Run a command, forwarding its output to the log line by line"""
+        proc = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+        )
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+            self.log_message(line.decode(errors="replace").rstrip())
+        return await proc.wait()
     
-    def install_systemd_service(self):
+    def write_file(self, path, content, mode=0o644):
+        """Atomically replace path with content in a single write"""
+        # Write beside the target and rename so readers such as systemctl
+        # never observe a half-written file
+        tmp_path = f"{path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            os.write(fd, content.encode('utf-8'))
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    
+    def install_binary(self, script_dir, install_dir, binary):
+        """Copy one binary into install_dir and return a log line"""
+        src = os.path.join(script_dir, binary)
+        dst = os.path.join(install_dir, binary)
+        if not os.path.exists(src):
+            return f"Warning: {binary} not found"
+        
+        if hasattr(os, "sendfile"):
+            # copyfile copies in-kernel via sendfile; the metadata copystat
+            # step of copy2 is pointless for a freshly installed binary
+            shutil.copyfile(src, dst)
+        else:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+        os.chmod(dst, 0o755)
+        return f"Installed: {binary}"
+    
+    def servin_ids(self):
+        """Return the cached (uid, gid) of the servin user and group"""
+        # NSS lookups may go to sssd/LDAP, so only resolve them once
+        if self._servin_ids is None:
+            self._servin_ids = (pwd.getpwnam("servin").pw_uid, grp.getgrnam("servin").gr_gid)
+        return self._servin_ids
+    
+    def chown_tree(self, path, uid, gid):
+        """Recursively hand path over to uid:gid"""
+        # chown -R walks the tree natively instead of one Python call per entry
+        try:
+            result = subprocess.run(["chown", "-R", f"{uid}:{gid}", path],
+                                    check=False, capture_output=True)
+            if result.returncode == 0:
+                return
+        except FileNotFoundError:
+            pass
+        
+        # Fall back to a per-entry walk; chown relative to each directory fd so
+        # paths aren't re-resolved from the root and symlinks aren't followed
+        os.chown(path, uid, gid)
+        for root, dirs, files, dir_fd in os.fwalk(path):
+            for name in dirs + files:
+                os.chown(name, uid, gid, dir_fd=dir_fd, follow_symlinks=False)
+    
+    async def install_systemd_service(self, install_dir, config_dir):
         service_content = f"""[Unit]
 Description=Servin Container Runtime
 After=network.target
@@ -519,18 +705,22 @@ After=network.target
 Type=simple
 User=servin
 Group=servin
-ExecStart={self.install_dir.get()}/servin daemon --config {self.config_dir.get()}/servin.conf
+ExecStart={shlex.quote(f"{install_dir}/servin")} daemon --config {shlex.quote(f"{config_dir}/servin.conf")}
 Restart=on-failure
 RestartSec=5
 
 [Install]
 WantedBy=multi-user.target"""
         
-        with open("/etc/systemd/system/servin.service", 'w') as f:
-            f.write(service_content)
+        self.write_file("/etc/systemd/system/servin.service", service_content)
         
-        subprocess.run(["systemctl", "daemon-reload"], check=False)
-        subprocess.run(["systemctl", "enable", "servin"], check=False)
+        # enable reads the unit file directly, so it doesn't have to wait for
+        # daemon-reload; run both at once
+        await asyncio.gather(
+            self.run_command("systemctl", "daemon-reload"),
+            self.run_command("systemctl", "enable", "servin"),
+            return_exceptions=True
+        )
         self.log_message("Installed systemd service")
     
     def finish_install(self):
@@ -558,15 +748,5 @@ WantedBy=multi-user.target"""
 
 
 if __name__ == "__main__":
-    # Check if tkinter is available
-    try:
-        import tkinter
-    except ImportError:
-        print("Error: tkinter is not available. Please install it:")
-        print("Ubuntu/Debian: sudo apt-get install python3-tk")
-        print("CentOS/RHEL: sudo yum install tkinter")
-        print("Or use the command-line installer: sudo ./install.sh")
-        sys.exit(1)
-    
     installer = ServinInstaller()
     installer.run()
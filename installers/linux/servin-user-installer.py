@@ -6,14 +6,103 @@ Installs to user directories without requiring sudo
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox
+import collections
 import os
+import queue
+import re
 import sys
-import subprocess
-import shutil
-import tempfile
+import threading
 from pathlib import Path
 
+# Installer payload (binaries, icons) ships alongside this script
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Inside a .pyz the binaries and icons ship next to the archive, not in it
+if os.path.isfile(SCRIPT_DIR):
+    SCRIPT_DIR = os.path.dirname(SCRIPT_DIR)
+HOME_DIR = Path.home()
+
+ICON_RE = re.compile(r"servin-icon-(\d+)\.png$")
+
+WELCOME_DESCRIPTION = """This installer will set up Servin Container Runtime in your user directories. No root privileges required!
+
+Servin provides:
+• Docker-compatible container management
+• Native Linux desktop application  
+• Command-line tools for automation
+• Lightweight containerization with Linux namespaces
+
+Features of this user installation:
+• Installs to ~/.local/bin (no sudo required)
+• Automatic PATH configuration
+• User-specific configuration
+• Desktop integration via .desktop files"""
+
+BENEFITS = (
+    "✅ No root password required",
+    "✅ Safe installation in user directories", 
+    "✅ Won't affect system-wide software",
+    "✅ Easy to uninstall or update",
+    "✅ Automatic shell integration"
+)
+
+PATH_INFO_TEMPLATE = """Installation follows XDG Base Directory specification:
+
+• Binaries: {install_dir}
+• Data: {data_dir}  
+• Configuration: {config_dir}
+
+The installer will automatically add {install_dir} to your PATH."""
+
+PATH_HELP = """Adding to PATH allows you to run 'servin' from any terminal window.
+This modifies your shell configuration files (.bashrc, .zshrc, etc.)"""
+
+SUMMARY_TEMPLATE = """Servin Container Runtime Installation Summary
+
+INSTALLATION DIRECTORIES:
+• Binaries: {install_dir}
+• Data: {data_dir}
+• Configuration: {config_dir}
+
+COMPONENTS:
+• Core Runtime (servin): ✓ Included
+• Desktop Application: {desktop_app}
+• Desktop Files: {desktop_files}
+
+CONFIGURATION:
+• Add to PATH: {add_to_path}
+• Installation Type: User installation (no sudo required)
+• Shell Integration: Automatic
+
+WHAT WILL BE INSTALLED:
+• servin - Main container runtime CLI{desktop_app_item}
+• Configuration files and documentation
+• Shell integration for PATH{desktop_entries_item}
+
+POST-INSTALLATION:
+• Commands will be available: servin{desktop_menu_item}
+• Configuration files will be created on first run
+• No system-wide changes will be made
+
+The installation is completely contained within your user directories and can be
+easily uninstalled by removing the installation directories."""
+
+SUCCESS_DESCRIPTION = """Servin Container Runtime has been successfully installed to your user directories.
+
+Next steps:
+1. Open a new terminal window (to load PATH changes)
+2. Run 'servin --help' to see available commands
+3. Try pulling an image: 'servin image pull alpine'
+4. Create and run a container: 'servin run alpine echo "Hello World"'
+
+The desktop application is available in your application menu."""
+
+QUICK_START_COMMANDS = (
+    "servin --help",
+    "servin image pull alpine",
+    "servin run alpine echo 'Hello World'"
+)
+
 class ServinLinuxInstaller:
     def __init__(self):
         self.root = tk.Tk()
@@ -21,32 +110,12 @@ class ServinLinuxInstaller:
         self.root.geometry("700x550")
         self.root.resizable(False, False)
         
-        # Set window icon if available
-        try:
-            # Try to load icon from the same directory as the installer
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            icon_path = os.path.join(script_dir, "servin-icon-64.png")
-            if os.path.exists(icon_path):
-                from PIL import Image, ImageTk
-                icon_image = Image.open(icon_path)
-                self.icon_photo = ImageTk.PhotoImage(icon_image)
-                self.root.iconphoto(True, self.icon_photo)
-            else:
-                # Fallback to trying different icon formats
-                for icon_file in ["servin.ico", "servin-icon-48.png", "servin-icon-32.png"]:
-                    icon_path = os.path.join(script_dir, icon_file)
-                    if os.path.exists(icon_path):
-                        if icon_file.endswith('.png'):
-                            from PIL import Image, ImageTk
-                            icon_image = Image.open(icon_path)
-                            self.icon_photo = ImageTk.PhotoImage(icon_image)
-                            self.root.iconphoto(True, self.icon_photo)
-                        break
-        except:
-            pass  # No icon if PIL not available or icon not found
+        # Set window icon once the main loop is running, off the startup path
+        self.icon_path = None
+        self.root.after_idle(self._load_icon)
         
         # Get user home directory
-        self.home_dir = Path.home()
+        self.home_dir = HOME_DIR
         
         # Installation variables - all in user directories
         self.install_dir = tk.StringVar(value=str(self.home_dir / ".local" / "bin"))
@@ -56,6 +125,13 @@ class ServinLinuxInstaller:
         self.add_to_path = tk.BooleanVar(value=True)
         self.create_desktop_files = tk.BooleanVar(value=True)
         
+        # Pending installation log lines, flushed by _drain_log
+        self._log_buf = collections.deque()
+        self._log_flush_scheduled = False
+        
+        # Set while an installation worker is running
+        self._installing = False
+        
         # Current page
         self.current_page = 0
         self.pages = []
@@ -63,7 +139,44 @@ class ServinLinuxInstaller:
         self.setup_ui()
         self.show_page(0)
     
+    def _load_icon(self):
+        """Set the window icon from the first icon shipped next to the installer"""
+        for icon_file in ["servin-icon-64.png", "servin.ico", "servin-icon-48.png", "servin-icon-32.png"]:
+            icon_path = os.path.join(SCRIPT_DIR, icon_file)
+            if not os.path.exists(icon_path):
+                continue
+            try:
+                # Tk 8.6 decodes PNG natively; only .ico needs Pillow
+                if icon_file.endswith('.png'):
+                    try:
+                        self.icon_photo = tk.PhotoImage(file=icon_path)
+                    except tk.TclError:
+                        self.icon_photo = self._load_icon_with_pil(icon_path)
+                else:
+                    self.icon_photo = self._load_icon_with_pil(icon_path)
+                self.root.iconphoto(True, self.icon_photo)
+                self.icon_path = icon_path
+                return
+            except:
+                pass  # No icon if PIL not available or the file can't be decoded
+    
+    def _load_icon_with_pil(self, icon_path):
+        from PIL import Image, ImageTk
+        return ImageTk.PhotoImage(Image.open(icon_path))
+    
     def setup_ui(self):
+        # Named label styles, configured once and shared by every page
+        style = ttk.Style()
+        style.configure("Title.TLabel", font=("Arial", 18, "bold"))
+        style.configure("Subtitle.TLabel", font=("Arial", 12))
+        style.configure("Heading.TLabel", font=("Arial", 16, "bold"))
+        style.configure("Section.TLabel", font=("Arial", 14, "bold"))
+        style.configure("Body.TLabel", font=("Arial", 11))
+        style.configure("Small.TLabel", font=("Arial", 10))
+        style.configure("Hint.TLabel", font=("Arial", 9), foreground="gray")
+        style.configure("Mono.TLabel", font=("monospace", 10))
+        style.configure("Success.TLabel", font=("Arial", 16, "bold"), foreground="green")
+        
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -73,11 +186,11 @@ class ServinLinuxInstaller:
         header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         
         title_label = ttk.Label(header_frame, text="Servin Container Runtime", 
-                               font=("Arial", 18, "bold"))
+                               style="Title.TLabel")
         title_label.grid(row=0, column=0, sticky=tk.W)
         
         subtitle_label = ttk.Label(header_frame, text="User Installation Wizard", 
-                                  font=("Arial", 12))
+                                  style="Subtitle.TLabel")
         subtitle_label.grid(row=1, column=0, sticky=tk.W)
         
         # Content frame
@@ -103,11 +216,13 @@ class ServinLinuxInstaller:
         self.setup_pages()
     
     def setup_pages(self):
+        # Build every page once; show_page only swaps which one is gridded.
+        # The installation and success pages stay as factories until reached.
         self.pages = [
-            self.create_welcome_page,
-            self.create_destination_page,
-            self.create_components_page,
-            self.create_summary_page,
+            self.create_welcome_page(),
+            self.create_destination_page(),
+            self.create_components_page(),
+            self.create_summary_page(),
             self.create_installation_page,
             self.create_success_page
         ]
@@ -120,24 +235,10 @@ class ServinLinuxInstaller:
         welcome_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N), pady=(0, 30))
         
         title = ttk.Label(welcome_frame, text="Welcome to Servin Container Runtime", 
-                         font=("Arial", 16, "bold"))
+                         style="Heading.TLabel")
         title.grid(row=0, column=0, sticky=tk.W, pady=(0, 15))
         
-        description = """This installer will set up Servin Container Runtime in your user directories. No root privileges required!
-
-Servin provides:
-• Docker-compatible container management
-• Native Linux desktop application  
-• Command-line tools for automation
-• Lightweight containerization with Linux namespaces
-
-Features of this user installation:
-• Installs to ~/.local/bin (no sudo required)
-• Automatic PATH configuration
-• User-specific configuration
-• Desktop integration via .desktop files"""
-        
-        desc_label = ttk.Label(welcome_frame, text=description, font=("Arial", 11), 
+        desc_label = ttk.Label(welcome_frame, text=WELCOME_DESCRIPTION, style="Body.TLabel", 
                               justify=tk.LEFT, wraplength=600)
         desc_label.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
@@ -145,16 +246,8 @@ Features of this user installation:
         benefits_frame = ttk.LabelFrame(page, text="Benefits of User Installation", padding="15")
         benefits_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         
-        benefits = [
-            "✅ No root password required",
-            "✅ Safe installation in user directories", 
-            "✅ Won't affect system-wide software",
-            "✅ Easy to uninstall or update",
-            "✅ Automatic shell integration"
-        ]
-        
-        for i, benefit in enumerate(benefits):
-            ttk.Label(benefits_frame, text=benefit, font=("Arial", 10)).grid(row=i, column=0, sticky=tk.W, pady=2)
+        ttk.Label(benefits_frame, text="\n".join(BENEFITS), style="Small.TLabel",
+                 justify=tk.LEFT).grid(row=0, column=0, sticky=tk.W)
         
         return page
     
@@ -162,7 +255,7 @@ Features of this user installation:
         page = ttk.Frame(self.content_frame, padding="20")
         
         ttk.Label(page, text="Installation Directories", 
-                 font=("Arial", 14, "bold")).grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
+                 style="Section.TLabel").grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
         
         # Destination selection
         dest_frame = ttk.LabelFrame(page, text="User Directory Locations", padding="15")
@@ -188,23 +281,26 @@ Features of this user installation:
         info_frame = ttk.LabelFrame(page, text="Path Information", padding="15")
         info_frame.grid(row=2, column=0, sticky=(tk.W, tk.E))
         
-        info_text = f"""Installation follows XDG Base Directory specification:
-
-• Binaries: {self.install_dir.get()}
-• Data: {self.data_dir.get()}  
-• Configuration: {self.config_dir.get()}
-
-The installer will automatically add {self.install_dir.get()} to your PATH."""
-
-        ttk.Label(info_frame, text=info_text, font=("Arial", 10), justify=tk.LEFT).grid(row=0, column=0, sticky=tk.W)
+        self.path_info_label = ttk.Label(info_frame, style="Small.TLabel", justify=tk.LEFT)
+        self.path_info_label.grid(row=0, column=0, sticky=tk.W)
         
         return page
     
+    def update_path_info(self):
+        """Refresh the path information with the current directories"""
+        info_text = PATH_INFO_TEMPLATE.format_map({
+            "install_dir": self.install_dir.get(),
+            "data_dir": self.data_dir.get(),
+            "config_dir": self.config_dir.get(),
+        })
+        
+        self.path_info_label.configure(text=info_text)
+    
     def create_components_page(self):
         page = ttk.Frame(self.content_frame, padding="20")
         
         ttk.Label(page, text="Select Components", 
-                 font=("Arial", 14, "bold")).grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
+                 style="Section.TLabel").grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
         
         # Components
         components_frame = ttk.LabelFrame(page, text="Components to Install", padding="15")
@@ -227,11 +323,8 @@ The installer will automatically add {self.install_dir.get()} to your PATH."""
                        variable=self.add_to_path).grid(row=0, column=0, sticky=tk.W, pady=3)
         
         # PATH explanation
-        path_info = """Adding to PATH allows you to run 'servin' from any terminal window.
-This modifies your shell configuration files (.bashrc, .zshrc, etc.)"""
-        
-        ttk.Label(config_frame, text=path_info, font=("Arial", 9), 
-                 foreground="gray", justify=tk.LEFT).grid(row=1, column=0, sticky=tk.W, padx=(20, 0))
+        ttk.Label(config_frame, text=PATH_HELP, style="Hint.TLabel", 
+                 justify=tk.LEFT).grid(row=1, column=0, sticky=tk.W, padx=(20, 0))
         
         return page
     
@@ -239,7 +332,7 @@ This modifies your shell configuration files (.bashrc, .zshrc, etc.)"""
         page = ttk.Frame(self.content_frame, padding="20")
         
         ttk.Label(page, text="Installation Summary", 
-                 font=("Arial", 14, "bold")).grid(row=0, column=0, sticky=tk.W, pady=(0, 15))
+                 style="Section.TLabel").grid(row=0, column=0, sticky=tk.W, pady=(0, 15))
         
         # Summary content
         summary_frame = ttk.Frame(page)
@@ -256,55 +349,34 @@ This modifies your shell configuration files (.bashrc, .zshrc, etc.)"""
         self.summary_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
-        # Update summary content
-        self.update_summary()
-        
         return page
     
     def update_summary(self):
         """Update the summary text with current settings"""
-        summary = f"""Servin Container Runtime Installation Summary
-
-INSTALLATION DIRECTORIES:
-• Binaries: {self.install_dir.get()}
-• Data: {self.data_dir.get()}
-• Configuration: {self.config_dir.get()}
-
-COMPONENTS:
-• Core Runtime (servin): ✓ Included
-• Desktop Application: {'✓ Included' if self.install_desktop.get() else '✗ Skipped'}
-• Desktop Files: {'✓ Included' if self.create_desktop_files.get() else '✗ Skipped'}
-
-CONFIGURATION:
-• Add to PATH: {'✓ Yes' if self.add_to_path.get() else '✗ No'}
-• Installation Type: User installation (no sudo required)
-• Shell Integration: Automatic
-
-WHAT WILL BE INSTALLED:
-• servin - Main container runtime CLI
-{'• servin-tui - Desktop GUI application' if self.install_desktop.get() else ''}
-• Configuration files and documentation
-• Shell integration for PATH
-{'• Desktop entries for application menu' if self.create_desktop_files.get() else ''}
-
-POST-INSTALLATION:
-• Commands will be available: servin
-{'• Desktop app available in application menu' if self.create_desktop_files.get() else ''}
-• Configuration files will be created on first run
-• No system-wide changes will be made
-
-The installation is completely contained within your user directories and can be
-easily uninstalled by removing the installation directories."""
-
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(tk.END, summary)
+        install_desktop = self.install_desktop.get()
+        create_desktop_files = self.create_desktop_files.get()
+        summary = SUMMARY_TEMPLATE.format_map({
+            "install_dir": self.install_dir.get(),
+            "data_dir": self.data_dir.get(),
+            "config_dir": self.config_dir.get(),
+            "desktop_app": "✓ Included" if install_desktop else "✗ Skipped",
+            "desktop_files": "✓ Included" if create_desktop_files else "✗ Skipped",
+            "add_to_path": "✓ Yes" if self.add_to_path.get() else "✗ No",
+            "desktop_app_item": "\n• servin-tui - Desktop GUI application" if install_desktop else "",
+            "desktop_entries_item": "\n• Desktop entries for application menu" if create_desktop_files else "",
+            "desktop_menu_item": "\n• Desktop app available in application menu" if create_desktop_files else "",
+        })
+        
+        # One replace command instead of delete + insert
+        self.summary_text.configure(state=tk.NORMAL)
+        self.summary_text.replace("1.0", tk.END, summary)
         self.summary_text.configure(state=tk.DISABLED)
     
     def create_installation_page(self):
         page = ttk.Frame(self.content_frame, padding="20")
         
         ttk.Label(page, text="Installing Servin Container Runtime", 
-                 font=("Arial", 14, "bold")).grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
+                 style="Section.TLabel").grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
         
         # Progress bar
         self.progress = ttk.Progressbar(page, mode='indeterminate')
@@ -335,20 +407,10 @@ easily uninstalled by removing the installation directories."""
         success_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 30))
         
         title = ttk.Label(success_frame, text="Installation Completed Successfully!", 
-                         font=("Arial", 16, "bold"), foreground="green")
+                         style="Success.TLabel")
         title.grid(row=0, column=0, sticky=tk.W, pady=(0, 15))
         
-        description = """Servin Container Runtime has been successfully installed to your user directories.
-
-Next steps:
-1. Open a new terminal window (to load PATH changes)
-2. Run 'servin --help' to see available commands
-3. Try pulling an image: 'servin image pull alpine'
-4. Create and run a container: 'servin run alpine echo "Hello World"'
-
-The desktop application is available in your application menu."""
-        
-        desc_label = ttk.Label(success_frame, text=description, font=("Arial", 11), 
+        desc_label = ttk.Label(success_frame, text=SUCCESS_DESCRIPTION, style="Body.TLabel", 
                               justify=tk.LEFT, wraplength=600)
         desc_label.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
@@ -356,28 +418,30 @@ The desktop application is available in your application menu."""
         commands_frame = ttk.LabelFrame(page, text="Quick Start Commands", padding="15")
         commands_frame.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
-        commands = [
-            "servin --help",
-            "servin image pull alpine",
-            "servin run alpine echo 'Hello World'"
-        ]
-        
-        for i, cmd in enumerate(commands):
-            cmd_label = ttk.Label(commands_frame, text=f"$ {cmd}", font=("monospace", 10))
-            cmd_label.grid(row=i, column=0, sticky=tk.W, pady=2)
+        commands_text = "\n".join(f"$ {cmd}" for cmd in QUICK_START_COMMANDS)
+        ttk.Label(commands_frame, text=commands_text, style="Mono.TLabel",
+                 justify=tk.LEFT).grid(row=0, column=0, sticky=tk.W)
         
         return page
     
     def show_page(self, page_num):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
         # Show current page
         if 0 <= page_num < len(self.pages):
+            for page in self.pages:
+                if not callable(page):
+                    page.grid_remove()
+            
+            if callable(self.pages[page_num]):
+                self.pages[page_num] = self.pages[page_num]()
+            
             self.current_page = page_num
-            page = self.pages[page_num]()
-            page.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+            self.pages[page_num].grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+            
+            # Refresh pages that reflect the chosen settings
+            if page_num == 1:
+                self.update_path_info()
+            elif page_num == 3:
+                self.update_summary()
             
             # Update buttons
             self.back_button.configure(state=tk.NORMAL if page_num > 0 else tk.DISABLED)
@@ -399,98 +463,173 @@ The desktop application is available in your application menu."""
             self.show_page(self.current_page + 1)
     
     def browse_directory(self, var):
+        from tkinter import filedialog
         directory = filedialog.askdirectory(initialdir=var.get())
         if directory:
             var.set(directory)
     
     def start_installation(self):
+        # Only one worker at a time; it owns self._q until it reports back
+        if self._installing:
+            return
+        self._installing = True
+        
+        # No going back mid-install; re-enabled if the install fails
+        self.back_button.configure(state=tk.DISABLED)
         self.progress.start()
-        self.root.after(100, self.perform_installation)
+        # Snapshot the settings on the Tk thread; the worker never touches Tk variables
+        options = {
+            "install_dir": self.install_dir.get(),
+            "data_dir": self.data_dir.get(),
+            "config_dir": self.config_dir.get(),
+            "install_desktop": self.install_desktop.get(),
+            "create_desktop_files": self.create_desktop_files.get(),
+            "add_to_path": self.add_to_path.get(),
+        }
+        
+        # Install on a worker thread so the progress bar keeps animating
+        self._q = queue.Queue()
+        threading.Thread(target=self._run_install_worker, args=(options,), daemon=True).start()
+        self.root.after(50, self._poll_install_queue)
     
-    def log_message(self, message):
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+    def _post(self, kind, value=None):
+        """Queue an update for the Tk thread (safe to call from the worker)"""
+        self._q.put((kind, value))
     
-    def perform_installation(self):
+    def _run_install_worker(self, options):
         try:
-            # Create directories
-            self.status_label.configure(text="Creating directories...")
-            self.log_message("🚀 Starting Servin installation")
-            
-            directories = [
-                self.install_dir.get(),
-                self.data_dir.get(),
-                self.config_dir.get(),
-                f"{self.data_dir.get()}/volumes",
-                f"{self.data_dir.get()}/images",
-                f"{self.data_dir.get()}/containers",
-                f"{self.data_dir.get()}/logs"
-            ]
+            self._install_worker(**options)
+        except Exception as e:
+            self._post("error", e)
+        else:
+            self._post("done")
+    
+    def _poll_install_queue(self):
+        """Apply updates posted by the installation worker (Tk thread only)"""
+        while True:
+            try:
+                kind, value = self._q.get_nowait()
+            except queue.Empty:
+                break
             
-            for directory in directories:
+            if kind == "log":
+                self.log_message(value)
+            elif kind == "status":
+                self.status_label.configure(text=value)
+            elif kind == "done":
+                self._installing = False
+                self.progress.stop()
+                # Enable next button
+                self.next_button.configure(state=tk.NORMAL)
+                return
+            elif kind == "error":
+                self._installing = False
+                self.progress.stop()
+                self.back_button.configure(state=tk.NORMAL)
+                self.log_message(f"❌ Error: {str(value)}")
+                messagebox.showerror("Installation Error", f"Installation failed:\n\n{str(value)}")
+                return
+        
+        self.root.after(50, self._poll_install_queue)
+    
+    def log_message(self, message):
+        # Coalesce lines and flush at most every 30ms instead of a full
+        # event-loop cycle per message
+        self._log_buf.append(f"{message}\n")
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(30, self._drain_log)
+    
+    def _drain_log(self):
+        self.log_text.insert(tk.END, "".join(self._log_buf))
+        self.log_text.see(tk.END)
+        self._log_buf.clear()
+        self._log_flush_scheduled = False
+    
+    def _install_worker(self, install_dir, data_dir, config_dir,
+                        install_desktop, create_desktop_files, add_to_path):
+        """Run the installation steps; called on the worker thread"""
+        import shutil
+        # Create directories
+        self._post("status", "Creating directories...")
+        self._post("log", "🚀 Starting Servin installation")
+        
+        directories = [
+            install_dir,
+            data_dir,
+            config_dir,
+            *(f"{data_dir}/{sub}" for sub in ("volumes", "images", "containers", "logs"))
+        ]
+        
+        # Shallowest first, so a directory whose parent we just created only
+        # needs a single mkdir instead of a makedirs walk up the whole chain
+        created = set()
+        for directory in sorted(set(map(os.path.normpath, directories)), key=lambda d: d.count(os.sep)):
+            if os.path.dirname(directory) in created:
+                try:
+                    os.mkdir(directory)
+                except FileExistsError:
+                    pass
+            else:
                 os.makedirs(directory, exist_ok=True)
-                self.log_message(f"📁 Created directory: {directory}")
-            
-            # Install binaries
-            self.status_label.configure(text="Installing binaries...")
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            binaries = ["servin"]
-            if self.install_desktop.get():
-                binaries.append("servin-tui")
-            
-            for binary in binaries:
-                src = os.path.join(script_dir, binary)
-                dst = os.path.join(self.install_dir.get(), binary)
-                if os.path.exists(src):
-                    shutil.copy2(src, dst)
-                    os.chmod(dst, 0o755)
-                    self.log_message(f"📦 Installed: {binary}")
-                else:
-                    self.log_message(f"⚠️  Warning: {binary} not found in installer package")
-            
-            # Create configuration
-            self.status_label.configure(text="Creating configuration...")
-            config_content = f"""# Servin Configuration File
-data_dir={self.data_dir.get()}
+            created.add(directory)
+            self._post("log", f"📁 Created directory: {directory}")
+        
+        # Install binaries
+        self._post("status", "Installing binaries...")
+        
+        binaries = ["servin"]
+        if install_desktop:
+            binaries.append("servin-tui")
+        
+        for binary in binaries:
+            src = os.path.join(SCRIPT_DIR, binary)
+            dst = os.path.join(install_dir, binary)
+            if os.path.exists(src):
+                shutil.copyfile(src, dst)
+                os.chmod(dst, 0o755)
+                self._post("log", f"📦 Installed: {binary}")
+            else:
+                self._post("log", f"⚠️  Warning: {binary} not found in installer package")
+        
+        # Create configuration
+        self._post("status", "Creating configuration...")
+        config_content = f"""# Servin Configuration File
+data_dir={data_dir}
 log_level=info
-log_file={self.data_dir.get()}/logs/servin.log
+log_file={data_dir}/logs/servin.log
 runtime=native
 bridge_name=servin0
 gui_theme=auto
 enable_notifications=true"""
-            
-            config_file = os.path.join(self.config_dir.get(), "servin.conf")
-            with open(config_file, 'w') as f:
-                f.write(config_content)
-            self.log_message("⚙️  Created configuration file")
-            
-            # Setup PATH
-            if self.add_to_path.get():
-                self.status_label.configure(text="Setting up PATH...")
-                self.setup_path()
-            
-            # Create desktop files
-            if self.create_desktop_files.get() and self.install_desktop.get():
-                self.status_label.configure(text="Creating desktop entries...")
-                self.create_desktop_files_func()
-            
-            self.progress.stop()
-            self.status_label.configure(text="Installation completed successfully!")
-            self.log_message("✅ Installation completed successfully!")
-            
-            # Enable next button
-            self.next_button.configure(state=tk.NORMAL)
-            
-        except Exception as e:
-            self.progress.stop()
-            self.log_message(f"❌ Error: {str(e)}")
-            messagebox.showerror("Installation Error", f"Installation failed:\n\n{str(e)}")
+        
+        config_file = os.path.join(config_dir, "servin.conf")
+        self.write_file(config_file, config_content)
+        self._post("log", "⚙️  Created configuration file")
+        
+        # Setup PATH
+        if add_to_path:
+            self._post("status", "Setting up PATH...")
+            self.setup_path(install_dir)
+        
+        # Create desktop files
+        if create_desktop_files and install_desktop:
+            self._post("status", "Creating desktop entries...")
+            self.create_desktop_files_func(install_dir)
+        
+        self._post("status", "Installation completed successfully!")
+        self._post("log", "✅ Installation completed successfully!")
     
-    def setup_path(self):
+    def write_file(self, path, content, mode=0o644):
+        """Write a small file with one os.write, bypassing the text I/O stack"""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+    
+    def setup_path(self, install_bin):
         """Add installation directory to PATH by modifying shell configuration files"""
-        install_bin = self.install_dir.get()
         
         # Shell configuration files to update
         shell_configs = [
@@ -499,67 +638,55 @@ enable_notifications=true"""
             self.home_dir / ".profile"
         ]
         
-        # PATH line to add
+        # PATH block to add, encoded once for every rc file
         path_line = f'export PATH="{install_bin}:$PATH"  # Added by Servin installer'
+        payload = f"\n# Servin Container Runtime\n{path_line}\n".encode()
         
+        # Only touch rc files the user already has; creating .bashrc or
+        # .profile can shadow a distro's ~/.bash_profile logic
         for config_file in shell_configs:
-            if config_file.exists() or config_file.name in [".bashrc", ".profile"]:
-                try:
-                    # Read existing content
-                    if config_file.exists():
-                        with open(config_file, 'r') as f:
-                            content = f.read()
-                    else:
-                        content = ""
+            try:
+                data = config_file.read_bytes()
+                
+                # Check if already added
+                if data.find(b"Added by Servin installer") == -1:
+                    # Add PATH export
+                    with open(config_file, 'ab') as f:
+                        f.write(payload)
+                    self._post("log", f"📝 Updated {config_file.name}")
+                else:
+                    self._post("log", f"📝 {config_file.name} already configured")
                     
-                    # Check if already added
-                    if "Added by Servin installer" not in content:
-                        # Add PATH export
-                        with open(config_file, 'a') as f:
-                            f.write(f"\n# Servin Container Runtime\n{path_line}\n")
-                        self.log_message(f"📝 Updated {config_file.name}")
-                    else:
-                        self.log_message(f"📝 {config_file.name} already configured")
-                        
-                except Exception as e:
-                    self.log_message(f"⚠️  Warning: Could not update {config_file.name}: {e}")
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                self._post("log", f"⚠️  Warning: Could not update {config_file.name}: {e}")
     
-    def create_desktop_files_func(self):
+    def create_desktop_files_func(self, install_dir):
         """Create .desktop files for Linux desktop integration"""
+        import shutil
         desktop_dir = self.home_dir / ".local" / "share" / "applications"
         desktop_dir.mkdir(parents=True, exist_ok=True)
         
         # Copy icon to user's icon directory
         icon_dir = self.home_dir / ".local" / "share" / "icons" / "hicolor"
-        script_dir = os.path.dirname(os.path.abspath(__file__))
         
-        icon_installed = False
         icon_name = "servin-tui"
         
-        # Try to install icon in different sizes
-        icon_sizes = [16, 32, 48, 64, 128, 256]
-        for size in icon_sizes:
-            icon_source = os.path.join(script_dir, f"servin-icon-{size}.png")
-            if os.path.exists(icon_source):
-                size_dir = icon_dir / f"{size}x{size}" / "apps"
-                size_dir.mkdir(parents=True, exist_ok=True)
-                icon_target = size_dir / f"{icon_name}.png"
-                shutil.copy2(icon_source, icon_target)
-                icon_installed = True
-                self.log_message(f"🎨 Installed {size}x{size} icon")
-        
-        # Fallback to copying any available icon
-        if not icon_installed:
-            for icon_file in ["servin-icon-64.png", "servin-icon-48.png", "servin.ico"]:
-                icon_source = os.path.join(script_dir, icon_file)
-                if os.path.exists(icon_source) and icon_file.endswith('.png'):
-                    apps_dir = icon_dir / "48x48" / "apps"
-                    apps_dir.mkdir(parents=True, exist_ok=True)
-                    icon_target = apps_dir / f"{icon_name}.png"
-                    shutil.copy2(icon_source, icon_target)
-                    icon_installed = True
-                    self.log_message("🎨 Installed fallback icon")
-                    break
+        # Install every sized icon shipped with the installer, found in one directory scan
+        with os.scandir(SCRIPT_DIR) as entries:
+            icons = sorted((int(m.group(1)), entry.path) for entry in entries
+                           if (m := ICON_RE.match(entry.name)))
+        for size, icon_source in icons:
+            size_dir = icon_dir / f"{size}x{size}" / "apps"
+            size_dir.mkdir(parents=True, exist_ok=True)
+            icon_target = size_dir / f"{icon_name}.png"
+            shutil.copyfile(icon_source, icon_target)
+            self._post("log", f"🎨 Installed {size}x{size} icon")
+        
+        # The scan already saw every servin-icon-*.png and .ico is not valid
+        # in hicolor, so without sized icons use the stock theme icon
+        icon_installed = bool(icons)
         
         # Desktop file content
         icon_reference = icon_name if icon_installed else "application-x-executable"
@@ -569,7 +696,7 @@ Version=1.0
 Type=Application
 Name=Servin Desktop
 Comment=Container Management with Servin
-Exec={self.install_dir.get()}/servin-tui
+Exec={install_dir}/servin-tui
 Icon={icon_reference}
 Terminal=false
 Categories=Development;System;
@@ -578,13 +705,10 @@ StartupNotify=true
 """
         
         desktop_file = desktop_dir / "servin-tui.desktop"
-        with open(desktop_file, 'w') as f:
-            f.write(desktop_content)
-        
-        # Make executable
-        os.chmod(desktop_file, 0o755)
+        # Desktop entries are created executable
+        self.write_file(desktop_file, desktop_content, mode=0o755)
         
-        self.log_message("🖥️  Created desktop entry")
+        self._post("log", "🖥️  Created desktop entry")
     
     def finish_installation(self):
         self.root.quit()
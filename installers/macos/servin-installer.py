@@ -6,15 +6,137 @@ A native macOS installer using tkinter with Cocoa styling
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
+import ctypes
 import os
+import platform
 import sys
 import subprocess
-import pwd
-import grp
+import shlex
 import shutil
-import tempfile
+import queue
+import threading
 import plistlib
-from pathlib import Path
+
+# APFS copy-on-write clone from libSystem; None where it is unavailable
+try:
+    CLONEFILE = ctypes.CDLL(None, use_errno=True).clonefile
+    CLONEFILE.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+    CLONEFILE.restype = ctypes.c_int
+except (OSError, AttributeError):
+    CLONEFILE = None
+
+# Extended license text to ensure scrolling is needed
+LICENSE_TEXT = """Apache License 2.0
+
+Copyright 2025 Servin Project
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+FULL LICENSE TEXT:
+
+                                 Apache License
+                           Version 2.0, January 2004
+                        http://www.apache.org/licenses/
+
+   TERMS AND CONDITIONS FOR USE, REPRODUCTION, AND DISTRIBUTION
+
+   1. Definitions.
+
+      "License" shall mean the terms and conditions for use, reproduction,
+      and distribution as defined by Sections 1 through 9 of this document.
+
+      "Licensor" shall mean the copyright owner or entity granting the License.
+
+      "Legal Entity" shall mean the union of the acting entity and all
+      other entities that control, are controlled by, or are under common
+      control with that entity. For the purposes of this definition,
+      "control" means (i) the power, direct or indirect, to cause the
+      direction or management of such entity, whether by contract or
+      otherwise, or (ii) ownership of fifty percent (50%) or more of the
+      outstanding shares, or (iii) beneficial ownership of such entity.
+
+   2. Grant of Copyright License. Subject to the terms and conditions of
+      this License, each Contributor hereby grants to You a perpetual,
+      worldwide, non-exclusive, no-charge, royalty-free, irrevocable
+      copyright license to use, reproduce, modify, display, perform,
+      sublicense, and distribute the Work and such Derivative Works in
+      Source or Object form.
+
+   3. Grant of Patent License. Subject to the terms and conditions of
+      this License, each Contributor hereby grants to You a perpetual,
+      worldwide, non-exclusive, no-charge, royalty-free, irrevocable
+      (except as stated in this section) patent license to make, have made,
+      use, offer to sell, sell, import, and otherwise transfer the Work.
+
+   4. Redistribution. You may reproduce and distribute copies of the
+      Work or Derivative Works thereof in any medium, with or without
+      modifications, and in Source or Object form, provided that You
+      meet the following conditions:
+
+      (a) You must give any other recipients of the Work or
+          Derivative Works a copy of this License;
+
+      (b) You must cause any modified files to carry prominent notices
+          stating that You changed the files;
+
+      (c) You must retain, in the Source form of any Derivative Works
+          that You distribute, all copyright, patent, trademark, and
+          attribution notices from the Source form of the Work.
+
+DISCLAIMER: This software is provided "AS IS" without warranty of any kind, 
+express or implied, including but not limited to the warranties of 
+merchantability, fitness for a particular purpose and noninfringement.
+
+By using this software, you acknowledge that you have read this license
+agreement and agree to be bound by its terms and conditions."""
+
+
+LAUNCHD_PLIST_PATH = "/Library/LaunchDaemons/com.servin.runtime.plist"
+
+# launchd job for the background service; install_launchd_service fills in
+# the program arguments, user and working directory
+LAUNCHD_PLIST = {
+    'Label': 'com.servin.runtime',
+    'GroupName': 'staff',
+    'RunAtLoad': True,
+    'KeepAlive': {
+        'SuccessfulExit': False,
+        'Crashed': True
+    },
+    'StandardOutPath': '/usr/local/var/log/servin/servin.stdout.log',
+    'StandardErrorPath': '/usr/local/var/log/servin/servin.stderr.log',
+    'EnvironmentVariables': {
+        'PATH': '/usr/local/bin:/usr/bin:/bin'
+    },
+    'ThrottleInterval': 10
+}
+
+# Info.plist for the GUI app bundle never changes, so serialize it once
+APP_INFO_PLIST = plistlib.dumps({
+    'CFBundleExecutable': 'Servin GUI',
+    'CFBundleIdentifier': 'com.servin.gui',
+    'CFBundleName': 'Servin GUI',
+    'CFBundleDisplayName': 'Servin GUI',
+    'CFBundleVersion': '1.0.0',
+    'CFBundleShortVersionString': '1.0.0',
+    'CFBundlePackageType': 'APPL',
+    'CFBundleSignature': 'SERV',
+    'LSMinimumSystemVersion': '10.12',
+    'NSHighResolutionCapable': True,
+    'LSApplicationCategoryType': 'public.app-category.developer-tools'
+}, fmt=plistlib.FMT_BINARY)
+
 
 class ServinMacInstaller:
     def __init__(self):
@@ -40,6 +162,12 @@ class ServinMacInstaller:
         # Check if running as root
         self.is_root = os.geteuid() == 0
         
+        # System version, read on first use
+        self._system_info = None
+        
+        # Updates posted by the installation worker thread
+        self._queue = queue.Queue()
+        
         # Current page
         self.current_page = 0
         self.pages = []
@@ -55,6 +183,18 @@ class ServinMacInstaller:
         except:
             pass
         
+        # Named fonts, created once and shared by every page
+        self.font_icon = tkfont.Font(family="SF Pro Display", size=24)
+        self.font_title = tkfont.Font(family="SF Pro Display", size=18, weight="bold")
+        self.font_subtitle = tkfont.Font(family="SF Pro Display", size=12)
+        self.font_heading = tkfont.Font(family="SF Pro Display", size=16, weight="bold")
+        self.font_section = tkfont.Font(family="SF Pro Display", size=14, weight="bold")
+        self.font_body = tkfont.Font(family="SF Pro Text", size=11)
+        self.font_warning = tkfont.Font(family="SF Pro Text", size=12, weight="bold")
+        self.font_mono = tkfont.Font(family="SF Mono", size=10)
+        self.font_mono_small = tkfont.Font(family="SF Mono", size=9)
+        self.font_success_icon = tkfont.Font(family="SF Pro Display", size=36)
+        
         # Main frame with padding
         main_frame = ttk.Frame(self.root, padding="30")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -69,15 +209,15 @@ class ServinMacInstaller:
         header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 30))
         
         # App icon placeholder (you'd include an actual icon here)
-        icon_label = ttk.Label(header_frame, text="📦", font=("SF Pro Display", 24))
+        icon_label = ttk.Label(header_frame, text="📦", font=self.font_icon)
         icon_label.grid(row=0, column=0, rowspan=2, padx=(0, 15))
         
         title_label = ttk.Label(header_frame, text="Servin Container Runtime", 
-                               font=("SF Pro Display", 18, "bold"))
+                               font=self.font_title)
         title_label.grid(row=0, column=1, sticky=tk.W)
         
         subtitle_label = ttk.Label(header_frame, text="Installation Assistant", 
-                                  font=("SF Pro Display", 12))
+                                  font=self.font_subtitle)
         subtitle_label.grid(row=1, column=1, sticky=tk.W)
         
         # Content frame
@@ -118,6 +258,14 @@ class ServinMacInstaller:
             self.create_installation_page,
             self.create_success_page
         ]
+        
+        # Build every page once; show_page only swaps which one is gridded
+        self.page_widgets = {}
+        for i, factory in enumerate(self.pages):
+            page = factory()
+            page.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+            page.grid_remove()
+            self.page_widgets[i] = page
     
     def create_welcome_page(self):
         page = ttk.Frame(self.content_frame, padding="20")
@@ -127,7 +275,7 @@ class ServinMacInstaller:
         welcome_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N), pady=(0, 30))
         
         title = ttk.Label(welcome_frame, text="Welcome to the Servin Container Runtime Installer", 
-                         font=("SF Pro Display", 16, "bold"))
+                         font=self.font_heading)
         title.grid(row=0, column=0, sticky=tk.W, pady=(0, 15))
         
         description = """This installer will guide you through the installation of Servin Container Runtime, a lightweight Docker-compatible container runtime with an intuitive GUI interface.
@@ -141,7 +289,7 @@ Servin provides:
 
 The installation requires administrator privileges and approximately 100MB of disk space."""
         
-        desc_label = ttk.Label(welcome_frame, text=description, font=("SF Pro Text", 11), 
+        desc_label = ttk.Label(welcome_frame, text=description, font=self.font_body, 
                               justify=tk.LEFT, wraplength=600)
         desc_label.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
@@ -150,12 +298,7 @@ The installation requires administrator privileges and approximately 100MB of di
         system_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         
         # Get macOS version
-        try:
-            version_output = subprocess.check_output(['sw_vers', '-productVersion'], text=True).strip()
-            build_output = subprocess.check_output(['sw_vers', '-buildVersion'], text=True).strip()
-            system_info = f"macOS {version_output} (Build {build_output})"
-        except:
-            system_info = "macOS (version detection failed)"
+        system_info = self.get_system_info()
         
         ttk.Label(system_frame, text=f"Current System: {system_info}").grid(row=0, column=0, sticky=tk.W)
         ttk.Label(system_frame, text="Required: macOS 10.12 (Sierra) or later").grid(row=1, column=0, sticky=tk.W)
@@ -167,12 +310,12 @@ The installation requires administrator privileges and approximately 100MB of di
             
             warning_label = ttk.Label(warning_frame, 
                                     text="⚠️ Administrator privileges required", 
-                                    foreground="#ff6b35", font=("SF Pro Text", 12, "bold"))
+                                    foreground="#ff6b35", font=self.font_warning)
             warning_label.grid(row=0, column=0, sticky=tk.W)
             
             note_label = ttk.Label(warning_frame, 
                                  text="Please run: sudo python3 servin-installer.py", 
-                                 font=("SF Mono", 10))
+                                 font=self.font_mono)
             note_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
         
         return page
@@ -181,7 +324,7 @@ The installation requires administrator privileges and approximately 100MB of di
         page = ttk.Frame(self.content_frame, padding="20")
         
         ttk.Label(page, text="Software License Agreement", 
-                 font=("SF Pro Display", 14, "bold")).grid(row=0, column=0, sticky=tk.W, pady=(0, 15))
+                 font=self.font_section).grid(row=0, column=0, sticky=tk.W, pady=(0, 15))
         
         license_frame = ttk.Frame(page)
         license_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 15))
@@ -190,87 +333,12 @@ The installation requires administrator privileges and approximately 100MB of di
         
         # License text with scrolling - reduced height to force scrolling
         text_widget = tk.Text(license_frame, height=12, wrap=tk.WORD, 
-                             font=("SF Mono", 10), borderwidth=1, relief=tk.SOLID,
+                             font=self.font_mono, borderwidth=1, relief=tk.SOLID,
                              bg="white", fg="black")
         scrollbar = ttk.Scrollbar(license_frame, orient=tk.VERTICAL, command=text_widget.yview)
         text_widget.configure(yscrollcommand=scrollbar.set)
         
-        # Extended license text to ensure scrolling is needed
-        license_text = """Apache License 2.0
-
-Copyright 2025 Servin Project
-
-Licensed under the Apache License, Version 2.0 (the "License");
-you may not use this file except in compliance with the License.
-You may obtain a copy of the License at
-
-    http://www.apache.org/licenses/LICENSE-2.0
-
-Unless required by applicable law or agreed to in writing, software
-distributed under the License is distributed on an "AS IS" BASIS,
-WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-See the License for the specific language governing permissions and
-limitations under the License.
-
-FULL LICENSE TEXT:
-
-                                 Apache License
-                           Version 2.0, January 2004
-                        http://www.apache.org/licenses/
-
-   TERMS AND CONDITIONS FOR USE, REPRODUCTION, AND DISTRIBUTION
-
-   1. Definitions.
-
-      "License" shall mean the terms and conditions for use, reproduction,
-      and distribution as defined by Sections 1 through 9 of this document.
-
-      "Licensor" shall mean the copyright owner or entity granting the License.
-
-      "Legal Entity" shall mean the union of the acting entity and all
-      other entities that control, are controlled by, or are under common
-      control with that entity. For the purposes of this definition,
-      "control" means (i) the power, direct or indirect, to cause the
-      direction or management of such entity, whether by contract or
-      otherwise, or (ii) ownership of fifty percent (50%) or more of the
-      outstanding shares, or (iii) beneficial ownership of such entity.
-
-   2. Grant of Copyright License. Subject to the terms and conditions of
-      this License, each Contributor hereby grants to You a perpetual,
-      worldwide, non-exclusive, no-charge, royalty-free, irrevocable
-      copyright license to use, reproduce, modify, display, perform,
-      sublicense, and distribute the Work and such Derivative Works in
-      Source or Object form.
-
-   3. Grant of Patent License. Subject to the terms and conditions of
-      this License, each Contributor hereby grants to You a perpetual,
-      worldwide, non-exclusive, no-charge, royalty-free, irrevocable
-      (except as stated in this section) patent license to make, have made,
-      use, offer to sell, sell, import, and otherwise transfer the Work.
-
-   4. Redistribution. You may reproduce and distribute copies of the
-      Work or Derivative Works thereof in any medium, with or without
-      modifications, and in Source or Object form, provided that You
-      meet the following conditions:
-
-      (a) You must give any other recipients of the Work or
-          Derivative Works a copy of this License;
-
-      (b) You must cause any modified files to carry prominent notices
-          stating that You changed the files;
-
-      (c) You must retain, in the Source form of any Derivative Works
-          that You distribute, all copyright, patent, trademark, and
-          attribution notices from the Source form of the Work.
-
-DISCLAIMER: This software is provided "AS IS" without warranty of any kind, 
-express or implied, including but not limited to the warranties of 
-merchantability, fitness for a particular purpose and noninfringement.
-
-By using this software, you acknowledge that you have read this license
-agreement and agree to be bound by its terms and conditions."""
-        
-        text_widget.insert(tk.END, license_text)
+        text_widget.insert(tk.END, LICENSE_TEXT)
         text_widget.configure(state=tk.DISABLED)
         
         # Enable mouse wheel scrolling
@@ -285,9 +353,8 @@ agreement and agree to be bound by its terms and conditions."""
         text_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
-        # Ensure text widget gets focus for scrolling
-        text_widget.focus_set()
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        # show_page gives the text widget focus for scrolling
+        self.license_text_widget = text_widget
         
         # Agreement checkbox
         agreement_frame = ttk.Frame(page)
@@ -305,7 +372,7 @@ agreement and agree to be bound by its terms and conditions."""
         page = ttk.Frame(self.content_frame, padding="20")
         
         ttk.Label(page, text="Select Installation Destination", 
-                 font=("SF Pro Display", 14, "bold")).grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
+                 font=self.font_section).grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
         
         # Destination selection
         dest_frame = ttk.LabelFrame(page, text="Installation Location", padding="15")
@@ -331,15 +398,14 @@ agreement and agree to be bound by its terms and conditions."""
         space_frame = ttk.LabelFrame(page, text="Disk Space", padding="15")
         space_frame.grid(row=2, column=0, sticky=(tk.W, tk.E))
         
-        try:
-            statvfs = os.statvfs(self.install_dir.get().split('/')[1] if self.install_dir.get().startswith('/') else '/')
-            free_space = statvfs.f_bavail * statvfs.f_frsize / (1024 * 1024 * 1024)  # GB
-            space_text = f"Available space: {free_space:.1f} GB"
-        except:
-            space_text = "Available space: Unable to calculate"
-        
         ttk.Label(space_frame, text="Space required: ~100 MB").grid(row=0, column=0, sticky=tk.W)
-        ttk.Label(space_frame, text=space_text).grid(row=1, column=0, sticky=tk.W)
+        self.space_label = ttk.Label(space_frame)
+        self.space_label.grid(row=1, column=0, sticky=tk.W)
+        
+        # Recompute only when the install directory actually changes
+        self._free_space = (None, None)
+        self.install_dir.trace_add('write', lambda *args: self.update_free_space())
+        self.update_free_space()
         
         return page
     
@@ -347,7 +413,7 @@ agreement and agree to be bound by its terms and conditions."""
         page = ttk.Frame(self.content_frame, padding="20")
         
         ttk.Label(page, text="Installation Type", 
-                 font=("SF Pro Display", 14, "bold")).grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
+                 font=self.font_section).grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
         
         # Standard installation
         standard_frame = ttk.LabelFrame(page, text="Components", padding="15")
@@ -387,7 +453,7 @@ agreement and agree to be bound by its terms and conditions."""
         page = ttk.Frame(self.content_frame, padding="20")
         
         ttk.Label(page, text="Installation Summary", 
-                 font=("SF Pro Display", 14, "bold")).grid(row=0, column=0, sticky=tk.W, pady=(0, 15))
+                 font=self.font_section).grid(row=0, column=0, sticky=tk.W, pady=(0, 15))
         
         # Summary text area with enhanced scrolling
         summary_frame = ttk.Frame(page)
@@ -397,7 +463,7 @@ agreement and agree to be bound by its terms and conditions."""
         
         # Reduced height to ensure scrolling is visible and functional
         self.summary_text = tk.Text(summary_frame, height=12, wrap=tk.WORD, 
-                                   font=("SF Mono", 10), borderwidth=1, relief=tk.SOLID,
+                                   font=self.font_mono, borderwidth=1, relief=tk.SOLID,
                                    bg="white", fg="black", state=tk.DISABLED)
         summary_scrollbar = ttk.Scrollbar(summary_frame, orient=tk.VERTICAL, command=self.summary_text.yview)
         self.summary_text.configure(yscrollcommand=summary_scrollbar.set)
@@ -420,18 +486,18 @@ agreement and agree to be bound by its terms and conditions."""
         page = ttk.Frame(self.content_frame, padding="20")
         
         ttk.Label(page, text="Installing Servin Container Runtime", 
-                 font=("SF Pro Display", 14, "bold")).grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
+                 font=self.font_section).grid(row=0, column=0, sticky=tk.W, pady=(0, 20))
         
         # Progress indicator
         progress_frame = ttk.Frame(page)
         progress_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 15))
         progress_frame.columnconfigure(0, weight=1)
         
-        self.progress = ttk.Progressbar(progress_frame, mode='indeterminate', length=500)
+        self.progress = ttk.Progressbar(progress_frame, mode='determinate', maximum=100, length=500)
         self.progress.grid(row=0, column=0, sticky=(tk.W, tk.E))
         
         self.status_label = ttk.Label(progress_frame, text="Preparing installation...", 
-                                     font=("SF Pro Text", 11))
+                                     font=self.font_body)
         self.status_label.grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
         
         # Installation log
@@ -441,7 +507,7 @@ agreement and agree to be bound by its terms and conditions."""
         log_frame.rowconfigure(0, weight=1)
         
         self.log_text = tk.Text(log_frame, height=12, wrap=tk.WORD, 
-                               font=("SF Mono", 9), borderwidth=1, relief=tk.SOLID)
+                               font=self.font_mono_small, borderwidth=1, relief=tk.SOLID)
         log_scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=log_scrollbar.set)
         
@@ -457,18 +523,18 @@ agreement and agree to be bound by its terms and conditions."""
         success_frame = ttk.Frame(page)
         success_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(20, 30))
         
-        success_icon = ttk.Label(success_frame, text="✅", font=("SF Pro Display", 36))
+        success_icon = ttk.Label(success_frame, text="✅", font=self.font_success_icon)
         success_icon.grid(row=0, column=0, padx=(0, 15))
         
         success_text = ttk.Label(success_frame, text="Installation Completed Successfully!", 
-                                font=("SF Pro Display", 16, "bold"))
+                                font=self.font_heading)
         success_text.grid(row=0, column=1, sticky=tk.W)
         
         # Summary of what was installed
         installed_frame = ttk.LabelFrame(page, text="Installed Components", padding="15")
         installed_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
         
-        self.installed_summary = ttk.Label(installed_frame, text="", font=("SF Pro Text", 11), 
+        self.installed_summary = ttk.Label(installed_frame, text="", font=self.font_body, 
                                           justify=tk.LEFT)
         self.installed_summary.grid(row=0, column=0, sticky=tk.W)
         
@@ -499,13 +565,9 @@ agreement and agree to be bound by its terms and conditions."""
             self.next_button.configure(state=tk.NORMAL if self.accept_license.get() else tk.DISABLED)
     
     def show_page(self, page_num):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create and show new page
-        page = self.pages[page_num]()
-        page.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Swap the visible page
+        self.page_widgets[self.current_page].grid_remove()
+        self.page_widgets[page_num].grid()
         
         # Update buttons based on page
         self.back_button.configure(state=tk.NORMAL if page_num > 0 else tk.DISABLED)
@@ -521,7 +583,10 @@ agreement and agree to be bound by its terms and conditions."""
         
         # Special handling for license page
         if page_num == 1:
-            self.next_button.configure(state=tk.DISABLED)
+            self.next_button.configure(state=tk.NORMAL if self.accept_license.get() else tk.DISABLED)
+            self.license_text_widget.focus_set()
+        else:
+            self.next_button.configure(state=tk.NORMAL)
         
         # Update summary page
         if page_num == 4:  # Summary page
@@ -530,21 +595,31 @@ agreement and agree to be bound by its terms and conditions."""
         self.current_page = page_num
     
     def update_summary(self):
+        install_dir = self.install_dir.get()
+        data_dir = self.data_dir.get()
+        config_dir = self.config_dir.get()
+        install_gui = self.install_gui.get()
+        install_service = self.install_service.get()
+        create_app_bundle = self.create_app_bundle.get()
+        create_user = self.create_user.get()
+        add_to_path = self.add_to_path.get()
+        install_cli_tools = self.install_cli_tools.get()
+        
         components = []
-        if self.install_gui.get():
+        if install_gui:
             components.append("Desktop GUI Application")
-        if self.install_service.get():
+        if install_service:
             components.append("Background Service (launchd)")
-        if self.create_app_bundle.get():
+        if create_app_bundle:
             components.append("Application Bundle")
         
         summary = f"""Installation Configuration Summary:
 
 Target Directories:
 ────────────────────────────────────────────────────
-• Installation Directory: {self.install_dir.get()}
-• Data Directory: {self.data_dir.get()}
-• Configuration Directory: {self.config_dir.get()}
+• Installation Directory: {install_dir}
+• Data Directory: {data_dir}
+• Configuration Directory: {config_dir}
 
 Core Components:
 ────────────────────────────────────────────────────
@@ -558,11 +633,11 @@ Core Components:
         if components:
             summary += "\nOptional Components:\n────────────────────────────────────────────────────\n"
         
-        if self.create_user.get():
+        if create_user:
             summary += "• System user '_servin' will be created\n"
-        if self.add_to_path.get():
+        if add_to_path:
             summary += "• Commands will be added to PATH environment\n"
-        if self.install_cli_tools.get():
+        if install_cli_tools:
             summary += "• Command-line tools and utilities\n"
         
         summary += f"""
@@ -577,21 +652,21 @@ Files to be installed:
 • servin (main executable)
 • servin-tui (terminal interface)"""
         
-        if self.install_gui.get():
+        if install_gui:
             summary += "\n• servin-gui (desktop application)"
         
-        if self.create_app_bundle.get():
+        if create_app_bundle:
             summary += "\n• Servin.app (macOS application bundle)"
         
-        if self.install_service.get():
+        if install_service:
             summary += "\n• com.servin.daemon.plist (launchd service)"
         
         summary += f"""
 
 Post-installation:
 ────────────────────────────────────────────────────
-• Configuration files will be created in {self.config_dir.get()}
-• Log files will be stored in {self.data_dir.get()}/logs
+• Configuration files will be created in {config_dir}
+• Log files will be stored in {data_dir}/logs
 • Service will be registered with launchd (if selected)
 • Desktop shortcuts will be created (if GUI selected)
 
@@ -606,9 +681,39 @@ the Servin container runtime on your system."""
         self.summary_text.insert(tk.END, summary)
         self.summary_text.configure(state=tk.DISABLED)
     
+    def update_free_space(self):
+        """Show free space on the volume holding the install directory"""
+        path = self.install_dir.get()
+        if self._free_space[0] != path:
+            # statvfs needs an existing path, so use the deepest existing ancestor
+            existing = os.path.abspath(path) if path else '/'
+            while not os.path.exists(existing):
+                existing = os.path.dirname(existing)
+            try:
+                free_space = shutil.disk_usage(existing).free / (1024 * 1024 * 1024)  # GB
+            except OSError:
+                free_space = None
+            self._free_space = (path, free_space)
+        
+        free_space = self._free_space[1]
+        if free_space is None:
+            self.space_label.configure(text="Available space: Unable to calculate")
+        else:
+            self.space_label.configure(text=f"Available space: {free_space:.1f} GB")
+    
+    def get_system_info(self):
+        """Describe the macOS version without shelling out to sw_vers"""
+        if self._system_info is None:
+            # mac_ver reads SystemVersion.plist in-process
+            release, _, machine = platform.mac_ver()
+            if release:
+                self._system_info = f"macOS {release} ({machine})"
+            else:
+                self._system_info = "macOS (version detection failed)"
+        return self._system_info
+    
     def get_platform(self):
         """Detect the macOS platform architecture"""
-        import platform
         arch = platform.machine()
         if arch == "arm64":
             return "Apple Silicon (M1/M2/M3)"
@@ -637,80 +742,157 @@ the Servin container runtime on your system."""
                                "Please run: sudo python3 servin-installer.py")
             return
         
+        # Tk variables may only be read on the Tk thread, so snapshot them here
+        options = {
+            "install_dir": self.install_dir.get(),
+            "data_dir": self.data_dir.get(),
+            "config_dir": self.config_dir.get(),
+            "install_gui": self.install_gui.get(),
+            "install_service": self.install_service.get(),
+            "create_user": self.create_user.get(),
+            "create_app_bundle": self.create_app_bundle.get(),
+        }
+        
         self.show_page(len(self.pages) - 2)  # Installation page
         self.next_button.configure(state=tk.DISABLED)
         self.back_button.configure(state=tk.DISABLED)
         self.cancel_button.configure(state=tk.DISABLED)
         
-        # Start progress animation
-        self.progress.start(10)
+        self.progress['value'] = 0
         
-        # Start installation
-        self.root.after(500, self.perform_installation)
+        # Start installation in background so the UI stays responsive
+        threading.Thread(target=self._install_worker, args=(options,), daemon=True).start()
+        self.root.after(50, self._poll_queue)
     
     def log_message(self, message):
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()  # Better UI responsiveness
-        self.root.update()
+        self._queue.put(("log", message))
     
     def update_status(self, message):
-        """Update status label and force UI update"""
-        self.status_label.configure(text=message)
-        self.root.update_idletasks()
-        self.root.update()
+        self._queue.put(("status", message))
     
-    def perform_installation(self):
-        try:
-            self.update_status("Creating directories...")
-            self.log_message("🚀 Starting Servin installation for macOS")
-            
-            # Create directories
-            directories = [
-                self.install_dir.get(),
-                self.data_dir.get(),
-                self.config_dir.get(),
-                f"{self.data_dir.get()}/volumes",
-                f"{self.data_dir.get()}/images",
-                "/usr/local/var/log/servin"
-            ]
-            
-            for i, directory in enumerate(directories):
-                try:
-                    os.makedirs(directory, exist_ok=True)
-                    self.log_message(f"📁 Created directory: {directory}")
-                    self.root.update_idletasks()  # Update UI during loop
-                except OSError as e:
-                    self.log_message(f"❌ Failed to create directory {directory}: {e}")
-                    raise
-            
-            # Install binaries
-            self.update_status("Installing binaries...")
-            script_dir = os.path.dirname(os.path.abspath(__file__))
+    def set_progress(self, value):
+        self._queue.put(("progress", value))
+    
+    def _poll_queue(self):
+        """Apply updates posted by the installation worker (Tk thread only)"""
+        # Coalesce every pending log line into one insert and one scroll
+        log_lines = []
+        finished = None
+        while finished is None:
+            try:
+                kind, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
             
-            # Check for package directory first
-            package_dir = os.path.join(script_dir, "package")
-            if os.path.exists(package_dir):
-                script_dir = package_dir
+            if kind == "log":
+                log_lines.append(value)
+            elif kind == "status":
+                self.status_label.configure(text=value)
+            elif kind == "progress":
+                self.progress['value'] = value
+            elif kind in ("done", "error"):
+                finished = (kind, value)
+        
+        if log_lines:
+            self.log_text.insert(tk.END, "\n".join(log_lines) + "\n")
+            self.log_text.see(tk.END)
+        
+        if finished is None:
+            self.root.after(50, self._poll_queue)
+            return
+        
+        if finished[0] == "done":
+            self.status_label.configure(text="Installation completed successfully!")
             
-            binaries = ["servin", "servin-tui"]
-            if self.install_gui.get():
-                binaries.append("servin-gui")
+            # Update success page
+            self.update_success_page()
             
-            for binary in binaries:
-                src = os.path.join(script_dir, binary)
-                dst = os.path.join(self.install_dir.get(), binary)
-                if os.path.exists(src):
-                    shutil.copy2(src, dst)
-                    os.chmod(dst, 0o755)
-                    self.log_message(f"📦 Installed: {binary}")
+            # Enable next button
+            self.next_button.configure(state=tk.NORMAL, text="Continue", command=self.go_next)
+        else:
+            messagebox.showerror("Installation Error", f"Installation failed:\n\n{finished[1]}")
+            self.cancel_button.configure(state=tk.NORMAL)
+    
+    def _install_worker(self, options):
+        try:
+            self.perform_installation(**options)
+        except Exception as e:
+            self.log_message(f"❌ Error: {str(e)}")
+            self._queue.put(("error", str(e)))
+        else:
+            self._queue.put(("done", True))
+    
+    def perform_installation(self, install_dir, data_dir, config_dir, install_gui,
+                             install_service, create_user, create_app_bundle):
+        """Run the installation steps; called on the worker thread"""
+        # Directories, binaries and configuration always run; the rest are optional
+        total_steps = 3 + create_user + install_service + (create_app_bundle and install_gui)
+        completed = 0
+        
+        def step_done():
+            nonlocal completed
+            completed += 1
+            self.set_progress(100 * completed / total_steps)
+        
+        self.update_status("Creating directories...")
+        self.log_message("🚀 Starting Servin installation for macOS")
+        
+        # Create directories
+        directories = [
+            install_dir,
+            data_dir,
+            config_dir,
+            f"{data_dir}/volumes",
+            f"{data_dir}/images",
+            "/usr/local/var/log/servin"
+        ]
+        
+        # Shallowest first, so a directory whose parent we just created only
+        # needs a single mkdir instead of a makedirs walk up the whole chain
+        created = set()
+        for directory in sorted(set(map(os.path.normpath, directories)), key=lambda d: d.count(os.sep)):
+            try:
+                if os.path.dirname(directory) in created:
+                    try:
+                        os.mkdir(directory)
+                    except FileExistsError:
+                        pass
                 else:
-                    self.log_message(f"⚠️  Warning: {binary} not found in installer package")
-            
-            # Create configuration
-            self.status_label.configure(text="Creating configuration...")
-            config_content = f"""# Servin Configuration File for macOS
-data_dir={self.data_dir.get()}
+                    os.makedirs(directory, exist_ok=True)
+                created.add(directory)
+                self.log_message(f"📁 Created directory: {directory}")
+            except OSError as e:
+                self.log_message(f"❌ Failed to create directory {directory}: {e}")
+                raise
+        step_done()
+        
+        # Install binaries
+        self.update_status("Installing binaries...")
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        
+        # Check for package directory first
+        package_dir = os.path.join(script_dir, "package")
+        if os.path.exists(package_dir):
+            script_dir = package_dir
+        
+        binaries = ["servin", "servin-tui"]
+        if install_gui:
+            binaries.append("servin-gui")
+        
+        for binary in binaries:
+            src = os.path.join(script_dir, binary)
+            dst = os.path.join(install_dir, binary)
+            if os.path.exists(src):
+                self.install_executable(src, dst)
+                self.log_message(f"📦 Installed: {binary}")
+            else:
+                self.log_message(f"⚠️  Warning: {binary} not found in installer package")
+        step_done()
+        
+        # Create configuration
+        self.update_status("Creating configuration...")
+        config_content = f"""# Servin Configuration File for macOS
+data_dir={data_dir}
 log_level=info
 log_file=/usr/local/var/log/servin/servin.log
 runtime=native
@@ -719,53 +901,92 @@ cri_port=10250
 cri_enabled=false
 gui_theme=auto
 enable_notifications=true"""
-            
-            with open(f"{self.config_dir.get()}/servin.conf", 'w') as f:
-                f.write(config_content)
-            self.log_message("⚙️  Created configuration file")
-            
-            # Create system user
-            if self.create_user.get():
-                self.status_label.configure(text="Creating system user...")
-                self.create_system_user()
-            
-            # Install launchd service
-            if self.install_service.get():
-                self.status_label.configure(text="Installing service...")
-                self.install_launchd_service()
-            
-            # Create application bundle
-            if self.create_app_bundle.get() and self.install_gui.get():
-                self.status_label.configure(text="Creating application bundle...")
-                self.create_application_bundle()
-            
-            self.progress.stop()
-            self.status_label.configure(text="Installation completed successfully!")
-            self.log_message("✅ Installation completed successfully!")
-            
-            # Update success page
-            self.update_success_page()
-            
-            # Enable next button
-            self.next_button.configure(state=tk.NORMAL, text="Continue", command=self.go_next)
-            
-        except Exception as e:
-            self.progress.stop()
-            self.log_message(f"❌ Error: {str(e)}")
-            messagebox.showerror("Installation Error", f"Installation failed:\n\n{str(e)}")
-            self.cancel_button.configure(state=tk.NORMAL)
+        
+        with open(f"{config_dir}/servin.conf", 'w') as f:
+            f.write(config_content)
+        self.log_message("⚙️  Created configuration file")
+        step_done()
+        
+        # Create system user
+        if create_user:
+            self.create_system_user()
+            step_done()
+        
+        # Install launchd service
+        if install_service:
+            self.install_launchd_service(install_dir, data_dir, config_dir, create_user)
+            step_done()
+        
+        # Create application bundle
+        if create_app_bundle and install_gui:
+            self.create_application_bundle(install_dir)
+            step_done()
+        
+        self.log_message("✅ Installation completed successfully!")
+    
+    def write_file(self, path, data, mode=0o644):
+        """Atomically replace path with data in a single write"""
+        # Write beside the target and rename so launchd never reads a
+        # half-written plist
+        tmp_path = f"{path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    
+    def install_executable(self, src, dst):
+        """Copy src to dst as a 0755 executable"""
+        # Replace rather than overwrite so a running binary is never modified
+        # in place, and create it 0755 so no separate chmod is needed
+        try:
+            os.unlink(dst)
+        except FileNotFoundError:
+            pass
+        
+        # On the same APFS volume a clone shares the blocks instead of copying
+        if CLONEFILE is not None and CLONEFILE(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            os.chmod(dst, 0o755)
+            return
+        
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            try:
+                size = os.fstat(src_fd).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            finally:
+                os.close(dst_fd)
+        except OSError:
+            # macOS only sendfiles to sockets; copyfile uses fcopyfile there
+            # and keeps the mode dst was created with
+            shutil.copyfile(src, dst)
+        finally:
+            os.close(src_fd)
+    
+    def used_uids(self):
+        """Return the set of UIDs already taken, from one directory query"""
+        try:
+            output = subprocess.check_output(['dscl', '.', '-list', '/Users', 'UniqueID'],
+                                             text=True, timeout=10)
+            return {int(fields[-1]) for fields in map(str.split, output.splitlines())
+                    if fields and fields[-1].lstrip('-').isdigit()}
+        except (OSError, subprocess.SubprocessError):
+            import pwd
+            return {entry.pw_uid for entry in pwd.getpwall()}
     
     def create_system_user(self):
         try:
             self.update_status("Creating system user...")
             # Find next available UID in system range
-            uid = 200
-            while uid < 500:
-                try:
-                    pwd.getpwuid(uid)
-                    uid += 1
-                except KeyError:
-                    break
+            used = self.used_uids()
+            uid = next((i for i in range(200, 500) if i not in used), 500)
             
             # Create user using dscl
             commands = [
@@ -777,74 +998,45 @@ enable_notifications=true"""
                 ['dscl', '.', '-create', '/Users/_servin', 'NFSHomeDirectory', '/var/empty']
             ]
             
-            for i, cmd in enumerate(commands):
-                try:
-                    result = subprocess.run(cmd, timeout=10, capture_output=True, text=True)
-                    if result.returncode != 0:
-                        self.log_message(f"⚠️  Warning: dscl command {i+1} failed: {result.stderr}")
-                    self.root.update_idletasks()
-                except subprocess.TimeoutExpired:
-                    self.log_message(f"⚠️  Warning: dscl command {i+1} timed out")
-                except Exception as e:
-                    self.log_message(f"⚠️  Warning: dscl command {i+1} failed: {e}")
+            # Run every dscl command from one shell instead of one subprocess.run
+            # each, reporting failures without stopping at the first one
+            script = "\n".join(
+                f"{shlex.join(cmd)} || echo 'dscl command {i+1} failed' >&2"
+                for i, cmd in enumerate(commands)
+            )
+            try:
+                result = subprocess.run(['/bin/sh'], input=script, timeout=30,
+                                        capture_output=True, text=True)
+                if result.stderr:
+                    self.log_message(f"⚠️  Warning: {result.stderr.strip()}")
+            except subprocess.TimeoutExpired:
+                self.log_message("⚠️  Warning: dscl commands timed out")
             
             self.log_message(f"👤 Created system user '_servin' with UID {uid}")
             
         except Exception as e:
             self.log_message(f"⚠️  Warning: Could not create system user: {str(e)}")
     
-    def install_launchd_service(self):
+    def install_launchd_service(self, install_dir, data_dir, config_dir, create_user):
         try:
             self.update_status("Installing launchd service...")
-            plist_path = "/Library/LaunchDaemons/com.servin.runtime.plist"
-            
-            plist_data = {
-                'Label': 'com.servin.runtime',
-                'ProgramArguments': [
-                    f"{self.install_dir.get()}/servin",
-                    'daemon',
-                    '--config',
-                    f"{self.config_dir.get()}/servin.conf"
-                ],
-                'UserName': '_servin' if self.create_user.get() else 'root',
-                'GroupName': 'staff',
-                'RunAtLoad': True,
-                'KeepAlive': {
-                    'SuccessfulExit': False,
-                    'Crashed': True
-                },
-                'StandardOutPath': '/usr/local/var/log/servin/servin.stdout.log',
-                'StandardErrorPath': '/usr/local/var/log/servin/servin.stderr.log',
-                'WorkingDirectory': self.data_dir.get(),
-                'EnvironmentVariables': {
-                    'PATH': '/usr/local/bin:/usr/bin:/bin'
-                },
-                'ThrottleInterval': 10
-            }
-            
-            with open(plist_path, 'wb') as f:
-                plistlib.dump(plist_data, f)
+            # Only the paths and user vary between installs
+            plist_data = dict(
+                LAUNCHD_PLIST,
+                ProgramArguments=[f"{install_dir}/servin", 'daemon', '--config', f"{config_dir}/servin.conf"],
+                UserName='_servin' if create_user else 'root',
+                WorkingDirectory=data_dir,
+            )
+            self.write_file(LAUNCHD_PLIST_PATH, plistlib.dumps(plist_data))
             
-            os.chmod(plist_path, 0o644)
+            # finish_install loads the job if "Start background service" is kept
+            self.log_message("🔧 Installed launchd service")
             
-            # Load service with timeout
-            try:
-                result = subprocess.run(['launchctl', 'load', plist_path], 
-                                      timeout=30, capture_output=True, text=True)
-                if result.returncode != 0:
-                    self.log_message(f"⚠️  Warning: launchctl load returned {result.returncode}: {result.stderr}")
-                else:
-                    self.log_message("🔧 Installed launchd service")
-            except subprocess.TimeoutExpired:
-                self.log_message("⚠️  Warning: launchctl load timed out, service may still be loading")
-            except Exception as e:
-                self.log_message(f"⚠️  Warning: Failed to load service: {e}")
-                
         except Exception as e:
             self.log_message(f"❌ Failed to install launchd service: {e}")
             raise
     
-    def create_application_bundle(self):
+    def create_application_bundle(self, install_dir):
         try:
             self.update_status("Creating application bundle...")
             app_path = "/Applications/Servin GUI.app"
@@ -855,14 +1047,12 @@ enable_notifications=true"""
             # Create directory structure
             for path in [macos_path, resources_path]:
                 os.makedirs(path, exist_ok=True)
-                self.root.update_idletasks()
             
             # Copy executable
-            gui_exe = f"{self.install_dir.get()}/servin-gui"
+            gui_exe = f"{install_dir}/servin-gui"
             if os.path.exists(gui_exe):
                 try:
-                    shutil.copy2(gui_exe, f"{macos_path}/Servin GUI")
-                    os.chmod(f"{macos_path}/Servin GUI", 0o755)
+                    self.install_executable(gui_exe, f"{macos_path}/Servin GUI")
                     self.log_message("📱 Copied GUI executable to app bundle")
                 except Exception as e:
                     self.log_message(f"⚠️  Warning: Failed to copy GUI executable: {e}")
@@ -871,22 +1061,7 @@ enable_notifications=true"""
                 return
             
             # Create Info.plist
-            info_plist = {
-                'CFBundleExecutable': 'Servin GUI',
-                'CFBundleIdentifier': 'com.servin.gui',
-                'CFBundleName': 'Servin GUI',
-                'CFBundleDisplayName': 'Servin GUI',
-                'CFBundleVersion': '1.0.0',
-                'CFBundleShortVersionString': '1.0.0',
-                'CFBundlePackageType': 'APPL',
-                'CFBundleSignature': 'SERV',
-                'LSMinimumSystemVersion': '10.12',
-                'NSHighResolutionCapable': True,
-                'LSApplicationCategoryType': 'public.app-category.developer-tools'
-            }
-            
-            with open(f"{contents_path}/Info.plist", 'wb') as f:
-                plistlib.dump(info_plist, f)
+            self.write_file(f"{contents_path}/Info.plist", APP_INFO_PLIST)
             
             self.log_message("🍎 Created application bundle")
             
@@ -909,23 +1084,52 @@ enable_notifications=true"""
         if hasattr(self, 'installed_summary'):
             self.installed_summary.configure(text=summary_text)
     
+    def spawn_detached(self, argv):
+        """Start argv in its own session without waiting for it"""
+        # posix_spawn avoids the fork+exec path subprocess.Popen takes
+        os.posix_spawnp(argv[0], argv, os.environ, setsid=True)
+    
+    def load_launchd_job(self):
+        """Submit the installed daemon to launchd, over XPC when PyObjC is available"""
+        try:
+            from ServiceManagement import SMJobSubmit, kSMDomainSystemLaunchd
+        except ImportError:
+            self.spawn_detached(['launchctl', 'load', LAUNCHD_PLIST_PATH])
+            return
+        try:
+            with open(LAUNCHD_PLIST_PATH, 'rb') as f:
+                job = plistlib.load(f)
+            # The installer runs as root, so no authorization ref is needed
+            ok, error = SMJobSubmit(kSMDomainSystemLaunchd, job, None, None)
+        except OSError:
+            raise
+        except Exception:
+            # objc.error, ValueError, TypeError from the bridge or a bad plist;
+            # callers only expect OSError, so retry through launchctl
+            ok = False
+        if not ok:
+            # e.g. the job is already loaded under that label; let launchctl sort it out
+            self.spawn_detached(['launchctl', 'load', LAUNCHD_PLIST_PATH])
+    
+    def open_path(self, path):
+        """Open path like /usr/bin/open, through Launch Services when PyObjC is available"""
+        try:
+            from AppKit import NSWorkspace
+            from Foundation import NSURL
+        except ImportError:
+            self.spawn_detached(['open', path])
+            return
+        if not NSWorkspace.sharedWorkspace().openURL_(NSURL.fileURLWithPath_(path)):
+            raise OSError(f"Launch Services could not open {path}")
+    
     def finish_install(self):
         # Perform final actions
         if self.start_service.get() and self.install_service.get():
+            # Loading a RunAtLoad job also starts it; don't wait for launchd
             try:
-                result = subprocess.run(['launchctl', 'start', 'com.servin.runtime'], 
-                                      timeout=15, capture_output=True, text=True)
-                if result.returncode == 0:
-                    self.log_message("✅ Started Servin service")
-                else:
-                    self.log_message(f"⚠️  Service start returned {result.returncode}: {result.stderr}")
-                    messagebox.showwarning("Service", "Could not start Servin service automatically.\n"
-                                         "You can start it manually from System Preferences.")
-            except subprocess.TimeoutExpired:
-                self.log_message("⚠️  Service start timed out")
-                messagebox.showwarning("Service", "Service start timed out.\n"
-                                     "You can start it manually from System Preferences.")
-            except Exception as e:
+                self.load_launchd_job()
+                self.log_message("✅ Started Servin service")
+            except OSError as e:
                 self.log_message(f"⚠️  Service start failed: {e}")
                 messagebox.showwarning("Service", "Could not start Servin service automatically.\n"
                                      "You can start it manually from System Preferences.")
@@ -933,12 +1137,12 @@ enable_notifications=true"""
         if self.launch_gui.get() and self.install_gui.get():
             try:
                 if self.create_app_bundle.get():
-                    subprocess.Popen(['open', '/Applications/Servin GUI.app'], start_new_session=True)
+                    self.open_path('/Applications/Servin GUI.app')
                     self.log_message("🚀 Launched GUI application")
                 else:
                     gui_path = f"{self.install_dir.get()}/servin-gui"
                     if os.path.exists(gui_path):
-                        subprocess.Popen([gui_path], start_new_session=True)
+                        self.spawn_detached([gui_path])
                         self.log_message("🚀 Launched GUI application")
                     else:
                         self.log_message("⚠️  GUI executable not found")
@@ -947,7 +1151,10 @@ enable_notifications=true"""
                 pass
         
         if self.open_applications.get():
-            subprocess.Popen(['open', '/Applications'], start_new_session=True)
+            try:
+                self.open_path('/Applications')
+            except Exception as e:
+                self.log_message(f"⚠️  Failed to open Applications folder: {e}")
         
         messagebox.showinfo("Installation Complete", 
                            "Servin Container Runtime has been successfully installed!\n\n"
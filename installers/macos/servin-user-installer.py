@@ -6,15 +6,77 @@ Installs to user directories without requiring sudo
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox
+import asyncio
+import collections
+import itertools
+import ctypes
 import os
-import sys
-import subprocess
-import shutil
-import tempfile
-import plistlib
+import queue
+import re
+import threading
 from pathlib import Path
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# APFS copy-on-write clone from libSystem; None where it is unavailable
+try:
+    CLONEFILE = ctypes.CDLL(None, use_errno=True).clonefile
+    CLONEFILE.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+    CLONEFILE.restype = ctypes.c_int
+except (OSError, AttributeError):
+    CLONEFILE = None
+
+# Info.plist for the desktop app bundle; the icon key is added per install
+APP_INFO_PLIST = {
+    'CFBundleExecutable': 'Servin Desktop',
+    'CFBundleIdentifier': 'com.servin.desktop',
+    'CFBundleName': 'Servin Desktop',
+    'CFBundleDisplayName': 'Servin Desktop',
+    'CFBundleVersion': '1.0.0',
+    'CFBundleShortVersionString': '1.0.0',
+    'CFBundlePackageType': 'APPL',
+    'CFBundleSignature': 'SERV',
+    'LSMinimumSystemVersion': '10.12',
+    'NSHighResolutionCapable': True,
+    'LSApplicationCategoryType': 'public.app-category.developer-tools',
+    'CFBundleDocumentTypes': [],
+    'NSRequiresAquaSystemAppearance': False
+}
+
+SUMMARY_TEMPLATE = """Servin Container Runtime Installation Summary
+
+INSTALLATION DIRECTORIES:
+• Binaries: {install_dir}
+• Data: {data_dir}
+• Configuration: {config_dir}
+
+COMPONENTS:
+• Core Runtime (servin): ✓ Included
+• Desktop Application: {desktop_app}
+• Application Bundle: {app_bundle}
+
+CONFIGURATION:
+• Add to PATH: {add_to_path}
+• Installation Type: User installation (no sudo required)
+• Shell Integration: Automatic
+
+WHAT WILL BE INSTALLED:
+• servin - Main container runtime CLI{desktop_app_item}
+• Configuration files and documentation
+• Shell integration for PATH
+
+POST-INSTALLATION:
+• Commands will be available: servin{app_bundle_item}
+• Configuration files will be created on first run
+• No system-wide changes will be made
+
+The installation is completely contained within your user directories and can be
+easily uninstalled by removing the installation directories."""
+
+# Marks the PATH line setup_path appends to shell rc files
+PATH_MARKER_RE = re.compile(rb"Added by Servin installer")
+
 class ServinMacInstaller:
     def __init__(self):
         self.root = tk.Tk()
@@ -28,21 +90,8 @@ class ServinMacInstaller:
         except:
             pass
         
-        # Set window icon if available
-        try:
-            # Try to load icon from the same directory as the installer
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            icon_path = os.path.join(script_dir, "servin-icon-64.png")
-            if os.path.exists(icon_path):
-                from PIL import Image, ImageTk
-                icon_image = Image.open(icon_path)
-                self.icon_photo = ImageTk.PhotoImage(icon_image)
-                self.root.iconphoto(True, self.icon_photo)
-            else:
-                # Fallback to system icon
-                self.root.iconphoto(True, tk.PhotoImage())
-        except:
-            pass  # No icon if PIL not available or icon not found
+        # Set window icon once the window is up, so Pillow never delays it
+        self.root.after_idle(self._load_icon)
         
         # Get user home directory
         self.home_dir = Path.home()
@@ -55,6 +104,21 @@ class ServinMacInstaller:
         self.add_to_path = tk.BooleanVar(value=True)
         self.create_app_bundle = tk.BooleanVar(value=True)
         
+        # Updates posted by the installation worker thread; posting one wakes
+        # the Tk thread with a virtual event instead of it polling with after()
+        self._queue = queue.SimpleQueue()
+        self._wakeup_pending = False
+        self.root.bind("<<InstallUpdate>>", self._drain_queue)
+        
+        # Log lines waiting for _flush_log
+        self._log_buffer = collections.deque()
+        self._log_flush_pending = False
+        
+        # Status updates are numbered so the drain can drop superseded ones
+        self._status_gen = itertools.count(1)
+        self._latest_status_gen = 0
+        self._status_text = "Preparing installation..."
+        
         # Current page
         self.current_page = 0
         self.pages = []
@@ -62,6 +126,24 @@ class ServinMacInstaller:
         self.setup_ui()
         self.show_page(0)
     
+    def _load_icon(self):
+        """Set the window icon from the icon shipped next to the installer"""
+        icon_path = SCRIPT_DIR / "servin-icon-64.png"
+        try:
+            if icon_path.exists():
+                # Tk 8.6 decodes PNG natively; only fall back to Pillow without it
+                try:
+                    self.icon_photo = tk.PhotoImage(file=str(icon_path))
+                except tk.TclError:
+                    from PIL import Image, ImageTk
+                    self.icon_photo = ImageTk.PhotoImage(Image.open(icon_path))
+                self.root.iconphoto(True, self.icon_photo)
+            else:
+                # Fallback to system icon
+                self.root.iconphoto(True, tk.PhotoImage())
+        except:
+            pass  # No icon if PIL not available or icon not found
+    
     def setup_ui(self):
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
@@ -110,6 +192,9 @@ class ServinMacInstaller:
             self.create_installation_page,
             self.create_success_page
         ]
+        
+        # Build every page once; show_page only swaps which one is gridded
+        self._page_frames = [factory() for factory in self.pages]
     
     def create_welcome_page(self):
         page = ttk.Frame(self.content_frame, padding="20")
@@ -187,17 +272,24 @@ Features of this user installation:
         info_frame = ttk.LabelFrame(page, text="Path Information", padding="15")
         info_frame.grid(row=2, column=0, sticky=(tk.W, tk.E))
         
+        self.path_info_label = ttk.Label(info_frame, font=("SF Pro Text", 10), justify=tk.LEFT)
+        self.path_info_label.grid(row=0, column=0, sticky=tk.W)
+        self.update_path_info()
+        
+        return page
+    
+    def update_path_info(self):
+        """Refresh the path information with the current directories"""
+        install_dir = self.install_dir.get()
         info_text = f"""Installation will create directories under your home folder:
 
-• Binaries: {self.install_dir.get()}
+• Binaries: {install_dir}
 • Data: {self.data_dir.get()}  
 • Configuration: {self.config_dir.get()}
 
-The installer will automatically add {self.install_dir.get()} to your PATH."""
-
-        ttk.Label(info_frame, text=info_text, font=("SF Pro Text", 10), justify=tk.LEFT).grid(row=0, column=0, sticky=tk.W)
+The installer will automatically add {install_dir} to your PATH."""
         
-        return page
+        self.path_info_label.configure(text=info_text)
     
     def create_components_page(self):
         page = ttk.Frame(self.content_frame, padding="20")
@@ -262,40 +354,22 @@ This modifies your shell configuration files (.zshrc, .bash_profile, etc.)"""
     
     def update_summary(self):
         """Update the summary text with current settings"""
-        summary = f"""Servin Container Runtime Installation Summary
-
-INSTALLATION DIRECTORIES:
-• Binaries: {self.install_dir.get()}
-• Data: {self.data_dir.get()}
-• Configuration: {self.config_dir.get()}
-
-COMPONENTS:
-• Core Runtime (servin): ✓ Included
-• Desktop Application: {'✓ Included' if self.install_desktop.get() else '✗ Skipped'}
-• Application Bundle: {'✓ Included' if self.create_app_bundle.get() else '✗ Skipped'}
-
-CONFIGURATION:
-• Add to PATH: {'✓ Yes' if self.add_to_path.get() else '✗ No'}
-• Installation Type: User installation (no sudo required)
-• Shell Integration: Automatic
-
-WHAT WILL BE INSTALLED:
-• servin - Main container runtime CLI
-{'• servin-tui - Desktop GUI application' if self.install_desktop.get() else ''}
-• Configuration files and documentation
-• Shell integration for PATH
-
-POST-INSTALLATION:
-• Commands will be available: servin
-{'• Desktop app available in Applications folder' if self.create_app_bundle.get() else ''}
-• Configuration files will be created on first run
-• No system-wide changes will be made
-
-The installation is completely contained within your user directories and can be
-easily uninstalled by removing the installation directories."""
-
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(tk.END, summary)
+        install_desktop = self.install_desktop.get()
+        create_app_bundle = self.create_app_bundle.get()
+        summary = SUMMARY_TEMPLATE.format_map({
+            "install_dir": self.install_dir.get(),
+            "data_dir": self.data_dir.get(),
+            "config_dir": self.config_dir.get(),
+            "desktop_app": "✓ Included" if install_desktop else "✗ Skipped",
+            "app_bundle": "✓ Included" if create_app_bundle else "✗ Skipped",
+            "add_to_path": "✓ Yes" if self.add_to_path.get() else "✗ No",
+            "desktop_app_item": "\n• servin-tui - Desktop GUI application" if install_desktop else "",
+            "app_bundle_item": "\n• Desktop app available in Applications folder" if create_app_bundle else "",
+        })
+        
+        # One replace command instead of delete + insert
+        self.summary_text.configure(state=tk.NORMAL)
+        self.summary_text.replace("1.0", tk.END, summary)
         self.summary_text.configure(state=tk.DISABLED)
     
     def create_installation_page(self):
@@ -367,15 +441,17 @@ The desktop application is available in your Applications folder."""
         return page
     
     def show_page(self, page_num):
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
         # Show current page
         if 0 <= page_num < len(self.pages):
+            self._page_frames[self.current_page].grid_forget()
             self.current_page = page_num
-            page = self.pages[page_num]()
-            page.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+            self._page_frames[page_num].grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+            
+            # Refresh pages that reflect the chosen settings
+            if page_num == 1:
+                self.update_path_info()
+            elif page_num == 3:
+                self.update_summary()
             
             # Update buttons
             self.back_button.configure(state=tk.NORMAL if page_num > 0 else tk.DISABLED)
@@ -397,98 +473,233 @@ The desktop application is available in your Applications folder."""
             self.show_page(self.current_page + 1)
     
     def browse_directory(self, var):
+        from tkinter import filedialog
         directory = filedialog.askdirectory(initialdir=var.get())
         if directory:
             var.set(directory)
     
     def start_installation(self):
+        # Tk variables may only be read on the Tk thread, so snapshot them here
+        options = {
+            "install_dir": Path(self.install_dir.get()),
+            "data_dir": Path(self.data_dir.get()),
+            "config_dir": Path(self.config_dir.get()),
+            "install_desktop": self.install_desktop.get(),
+            "add_to_path": self.add_to_path.get(),
+            "create_app_bundle": self.create_app_bundle.get(),
+        }
+        
+        # The log widgets must outlive the worker, so no going back mid-install
+        self.back_button.configure(state=tk.DISABLED)
         self.progress.start()
-        self.root.after(100, self.perform_installation)
+        
+        threading.Thread(target=self._install_worker, args=(options,), daemon=True).start()
+    
+    def _post(self, kind, value):
+        """Queue an update for the Tk thread; safe to call from any thread"""
+        self._queue.put((kind, value))
+        # One wakeup covers everything queued before _drain_queue runs
+        if not self._wakeup_pending:
+            self._wakeup_pending = True
+            self.root.event_generate("<<InstallUpdate>>", when="tail")
     
     def log_message(self, message):
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+        self._post("log", message)
     
-    def perform_installation(self):
-        try:
-            # Create directories
-            self.status_label.configure(text="Creating directories...")
-            self.log_message("🚀 Starting Servin installation")
-            
-            directories = [
-                self.install_dir.get(),
-                self.data_dir.get(),
-                self.config_dir.get(),
-                f"{self.data_dir.get()}/volumes",
-                f"{self.data_dir.get()}/images",
-                f"{self.data_dir.get()}/containers",
-                f"{self.data_dir.get()}/logs"
-            ]
-            
-            for directory in directories:
-                os.makedirs(directory, exist_ok=True)
-                self.log_message(f"📁 Created directory: {directory}")
-            
-            # Install binaries
-            self.status_label.configure(text="Installing binaries...")
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            
-            binaries = ["servin"]
-            if self.install_desktop.get():
-                binaries.append("servin-tui")
-            
-            for binary in binaries:
-                src = os.path.join(script_dir, binary)
-                dst = os.path.join(self.install_dir.get(), binary)
-                if os.path.exists(src):
-                    shutil.copy2(src, dst)
-                    os.chmod(dst, 0o755)
-                    self.log_message(f"📦 Installed: {binary}")
-                else:
-                    self.log_message(f"⚠️  Warning: {binary} not found in installer package")
-            
-            # Create configuration
-            self.status_label.configure(text="Creating configuration...")
-            config_content = f"""# Servin Configuration File
-data_dir={self.data_dir.get()}
-log_level=info
-log_file={self.data_dir.get()}/logs/servin.log
-runtime=native
-bridge_name=servin0
-gui_theme=auto
-enable_notifications=true"""
-            
-            config_file = os.path.join(self.config_dir.get(), "servin.conf")
-            with open(config_file, 'w') as f:
-                f.write(config_content)
-            self.log_message("⚙️  Created configuration file")
-            
-            # Setup PATH
-            if self.add_to_path.get():
-                self.status_label.configure(text="Setting up PATH...")
-                self.setup_path()
-            
-            # Create application bundle
-            if self.create_app_bundle.get() and self.install_desktop.get():
-                self.status_label.configure(text="Creating application bundle...")
-                self.create_application_bundle()
+    def update_status(self, message):
+        gen = next(self._status_gen)
+        self._latest_status_gen = gen
+        self._post("status", (gen, message))
+    
+    def _drain_queue(self, event=None):
+        """Apply updates posted by the installation worker (Tk thread only)"""
+        # Cleared before draining so a post racing with us raises a new event
+        self._wakeup_pending = False
+        finished = None
+        status = None
+        while finished is None:
+            try:
+                kind, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
             
-            self.progress.stop()
+            if kind == "log":
+                self._log_buffer.append(f"{value}\n")
+            elif kind == "status":
+                gen, text = value
+                if gen == self._latest_status_gen:
+                    status = text
+            elif kind in ("done", "error"):
+                finished = (kind, value)
+        
+        # Coalesce every pending log line into one insert and one scroll
+        if self._log_buffer and not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after_idle(self._flush_log)
+        
+        # Only the newest status is shown, and only repainted when it changed
+        if status is not None and status != self._status_text:
+            self._status_text = status
+            self.status_label.configure(text=status)
+        
+        if finished is None:
+            return
+        
+        self.progress.stop()
+        if finished[0] == "done":
             self.status_label.configure(text="Installation completed successfully!")
-            self.log_message("✅ Installation completed successfully!")
             
             # Enable next button
             self.next_button.configure(state=tk.NORMAL)
-            
+        else:
+            # Let the user go back, adjust the settings and retry
+            self.back_button.configure(state=tk.NORMAL)
+            messagebox.showerror("Installation Error", f"Installation failed:\n\n{finished[1]}")
+    
+    def _flush_log(self):
+        self.log_text.insert(tk.END, "".join(self._log_buffer))
+        self.log_text.see(tk.END)
+        self._log_buffer.clear()
+        self._log_flush_pending = False
+    
+    def _install_worker(self, options):
+        try:
+            asyncio.run(self.perform_installation(**options))
         except Exception as e:
-            self.progress.stop()
             self.log_message(f"❌ Error: {str(e)}")
-            messagebox.showerror("Installation Error", f"Installation failed:\n\n{str(e)}")
+            self._post("error", str(e))
+        else:
+            self._post("done", True)
+    
+    async def perform_installation(self, install_dir, data_dir, config_dir, install_desktop,
+                                   add_to_path, create_app_bundle):
+        """Run the installation steps; driven by asyncio.run on the worker thread"""
+        # Create directories
+        self.update_status("Creating directories...")
+        self.log_message("🚀 Starting Servin installation")
+        
+        directories = [
+            install_dir,
+            data_dir,
+            config_dir,
+            data_dir / "volumes",
+            data_dir / "images",
+            data_dir / "containers",
+            data_dir / "logs"
+        ]
+        
+        # Shallowest first, so a directory whose parent we just created only
+        # needs a single mkdir instead of a makedirs walk up the whole chain
+        created = set()
+        for directory in sorted(set(directories), key=lambda d: len(d.parts)):
+            if directory.parent in created:
+                try:
+                    directory.mkdir()
+                except FileExistsError:
+                    pass
+            else:
+                directory.mkdir(parents=True, exist_ok=True)
+            created.add(directory)
+        self.log_message(f"📁 Created {len(created)} directories")
+        
+        # Binaries, config and PATH touch disjoint files, so run them concurrently
+        self.update_status("Installing files...")
+        binaries = ["servin"]
+        if install_desktop:
+            binaries.append("servin-tui")
+        
+        steps = [self._install_binaries(install_dir, binaries),
+                 asyncio.to_thread(self._write_config, config_dir, data_dir)]
+        if add_to_path:
+            steps.append(asyncio.to_thread(self.setup_path, install_dir))
+        await asyncio.gather(*steps)
+        
+        # Create application bundle
+        if create_app_bundle and install_desktop:
+            self.update_status("Creating application bundle...")
+            await asyncio.to_thread(self.create_application_bundle, install_dir)
+        
+        self.log_message("✅ Installation completed successfully!")
+    
+    async def _install_binaries(self, install_dir, binaries):
+        """Copy the binaries in parallel; they are independent files"""
+        messages = await asyncio.gather(
+            *(asyncio.to_thread(self._install_binary, install_dir, binary) for binary in binaries))
+        for message in messages:
+            self.log_message(message)
+    
+    def _write_config(self, config_dir, data_dir):
+        """Write the default servin.conf"""
+        config_content = f"""# Servin Configuration File
+data_dir={data_dir}
+log_level=info
+log_file={data_dir / "logs" / "servin.log"}
+runtime=native
+bridge_name=servin0
+gui_theme=auto
+enable_notifications=true"""
+        
+        (config_dir / "servin.conf").write_text(config_content)
+        self.log_message("⚙️  Created configuration file")
+    
+    def _fast_copy(self, src, dst, mode=0o644):
+        """Copy src to a new dst with mode, without moving the bytes through Python"""
+        # Replace rather than overwrite; clonefile also refuses an existing dst
+        try:
+            os.unlink(dst)
+        except FileNotFoundError:
+            pass
+        
+        # On the same APFS volume a clone shares the blocks instead of copying
+        if CLONEFILE is not None and CLONEFILE(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            os.chmod(dst, mode)
+            return
+        
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+            try:
+                size = os.fstat(src_fd).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            finally:
+                os.close(dst_fd)
+        except OSError:
+            # macOS only sendfiles to sockets; copyfile uses fcopyfile there
+            # and keeps the mode dst was created with
+            import shutil
+            shutil.copyfile(src, dst)
+        finally:
+            os.close(src_fd)
     
-    def setup_path(self):
+    def _install_binary(self, install_dir, binary):
+        """Copy one binary into install_dir and return a log line"""
+        src = SCRIPT_DIR / binary
+        dst = install_dir / binary
+        try:
+            src_mode = os.stat(src).st_mode
+        except FileNotFoundError:
+            return f"⚠️  Warning: {binary} not found in installer package"
+        
+        # A hard link shares the inode, and so the mode, with the package copy;
+        # only take it when that copy is already executable as installed
+        if src_mode & 0o777 == 0o755:
+            try:
+                dst.unlink(missing_ok=True)
+                os.link(src, dst)
+                return f"📦 Installed: {binary}"
+            except OSError:
+                pass  # EXDEV when the package is on another volume
+        
+        self._fast_copy(src, dst, 0o755)
+        return f"📦 Installed: {binary}"
+    
+    def setup_path(self, install_bin):
         """Add installation directory to PATH by modifying shell configuration files"""
-        install_bin = self.install_dir.get()
         
         # Shell configuration files to update
         shell_configs = [
@@ -497,33 +708,46 @@ enable_notifications=true"""
             self.home_dir / ".bashrc"
         ]
         
-        # PATH line to add
+        # PATH block to add, encoded once for every rc file
         path_line = f'export PATH="{install_bin}:$PATH"  # Added by Servin installer'
+        payload = f"\n# Servin Container Runtime\n{path_line}\n".encode()
         
+        lines = []
         for config_file in shell_configs:
-            if config_file.exists() or config_file.name == ".zshrc":  # Always create .zshrc on macOS
-                try:
-                    # Read existing content
-                    if config_file.exists():
-                        with open(config_file, 'r') as f:
-                            content = f.read()
-                    else:
-                        content = ""
-                    
-                    # Check if already added
-                    if "Added by Servin installer" not in content:
-                        # Add PATH export
-                        with open(config_file, 'a') as f:
-                            f.write(f"\n# Servin Container Runtime\n{path_line}\n")
-                        self.log_message(f"📝 Updated {config_file.name}")
-                    else:
-                        self.log_message(f"📝 {config_file.name} already configured")
-                        
-                except Exception as e:
-                    self.log_message(f"⚠️  Warning: Could not update {config_file.name}: {e}")
+            # Always create .zshrc on macOS; only touch the others if they exist
+            flags = os.O_RDWR | os.O_APPEND
+            if config_file.name == ".zshrc":
+                flags |= os.O_CREAT
+            try:
+                fd = os.open(config_file, flags, 0o644)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                lines.append(f"⚠️  Warning: Could not update {config_file.name}: {e}")
+                continue
+            
+            try:
+                # Scan the raw bytes; no need to decode the whole file
+                content = bytearray()
+                while chunk := os.read(fd, 1 << 16):
+                    content += chunk
+                
+                if PATH_MARKER_RE.search(content) is None:
+                    os.write(fd, payload)
+                    lines.append(f"📝 Updated {config_file.name}")
+                else:
+                    lines.append(f"📝 {config_file.name} already configured")
+            except OSError as e:
+                lines.append(f"⚠️  Warning: Could not update {config_file.name}: {e}")
+            finally:
+                os.close(fd)
+        
+        if lines:
+            self.log_message("\n".join(lines))
     
-    def create_application_bundle(self):
+    def create_application_bundle(self, install_dir):
         """Create macOS Application Bundle for the desktop app"""
+        import plistlib
         app_path = Path.home() / "Applications" / "Servin Desktop.app"
         contents_path = app_path / "Contents"
         macos_path = contents_path / "MacOS"
@@ -534,55 +758,33 @@ enable_notifications=true"""
             path.mkdir(parents=True, exist_ok=True)
         
         # Copy executable
-        desktop_exe = Path(self.install_dir.get()) / "servin-tui"
+        desktop_exe = install_dir / "servin-tui"
         if desktop_exe.exists():
             target_exe = macos_path / "Servin Desktop"
-            shutil.copy2(desktop_exe, target_exe)
-            os.chmod(target_exe, 0o755)
+            self._fast_copy(desktop_exe, target_exe, 0o755)
             self.log_message("🍎 Copied desktop executable to app bundle")
         
-        # Copy icon if available
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        icon_sources = [
-            os.path.join(script_dir, "servin.icns"),
-            os.path.join(script_dir, "servin-icon-512.png"),
-            os.path.join(script_dir, "servin-icon-256.png")
-        ]
+        # Copy icon if available, preferring .icns; one directory read
+        # instead of a stat per candidate
+        with os.scandir(SCRIPT_DIR) as entries:
+            shipped = {entry.name: entry.path for entry in entries if entry.name.startswith('servin')}
         
         icon_copied = False
-        for icon_path in icon_sources:
-            if os.path.exists(icon_path):
-                icon_name = "servin.icns" if icon_path.endswith('.icns') else "servin.png"
+        for icon_file in ("servin.icns", "servin-icon-512.png", "servin-icon-256.png"):
+            if icon_file in shipped:
+                icon_name = "servin.icns" if icon_file.endswith('.icns') else "servin.png"
                 target_icon = resources_path / icon_name
-                shutil.copy2(icon_path, target_icon)
+                self._fast_copy(shipped[icon_file], target_icon)
                 self.log_message(f"🎨 Copied application icon: {icon_name}")
                 icon_copied = True
                 break
         
-        # Create Info.plist
-        info_plist = {
-            'CFBundleExecutable': 'Servin Desktop',
-            'CFBundleIdentifier': 'com.servin.desktop',
-            'CFBundleName': 'Servin Desktop',
-            'CFBundleDisplayName': 'Servin Desktop',
-            'CFBundleVersion': '1.0.0',
-            'CFBundleShortVersionString': '1.0.0',
-            'CFBundlePackageType': 'APPL',
-            'CFBundleSignature': 'SERV',
-            'LSMinimumSystemVersion': '10.12',
-            'NSHighResolutionCapable': True,
-            'LSApplicationCategoryType': 'public.app-category.developer-tools',
-            'CFBundleDocumentTypes': [],
-            'NSRequiresAquaSystemAppearance': False
-        }
-        
-        # Add icon reference if we copied one
+        # Create Info.plist, adding the icon reference if we copied one
+        info_plist = APP_INFO_PLIST
         if icon_copied:
-            info_plist['CFBundleIconFile'] = 'servin'
+            info_plist = dict(APP_INFO_PLIST, CFBundleIconFile='servin')
         
-        plist_path = contents_path / "Info.plist"
-        with open(plist_path, 'wb') as f:
-            plistlib.dump(info_plist, f)
+        (contents_path / "Info.plist").write_bytes(plistlib.dumps(info_plist, fmt=plistlib.FMT_BINARY))
         
         self.log_message("🍎 Created application bundle")
     
@@ -8,6 +8,22 @@ import requests
 import json
 import time
 
+BASE_URL = "http://127.0.0.1:5555"
+STATUS_URL = f"{BASE_URL}/api/vm/status"
+
+# One session keeps the connection to the local API alive between calls
+SESSION = requests.Session()
+
+# (name, method, full URL) for each VM operation, built once
+OPERATIONS = [
+    (name, method, f"{BASE_URL}{endpoint}")
+    for name, method, endpoint in [
+        ("Start VM", "POST", "/api/vm/start"),
+        ("Stop VM", "POST", "/api/vm/stop"),
+        ("Restart VM", "POST", "/api/vm/restart")
+    ]
+]
+
 def test_vm_status_api():
     """Test the VM status API and display the response"""
     print("Testing Enhanced VM Status Display")
@@ -15,7 +31,7 @@ def test_vm_status_api():
     
     try:
         # Test VM status endpoint
-        response = requests.get('http://127.0.0.1:5555/api/vm/status', timeout=10)
+        response = SESSION.get(STATUS_URL, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -54,7 +70,7 @@ def test_vm_status_api():
             
     except requests.exceptions.RequestException as e:
         print(f"❌ Connection Error: {e}")
-        print("Make sure the Flask app is running on http://127.0.0.1:5555")
+        print(f"Make sure the Flask app is running on {BASE_URL}")
 
 def test_vm_operations():
     """Test VM operation endpoints"""
@@ -62,15 +78,9 @@ def test_vm_operations():
     print("VM Operations Test (Visual Only)")
     print("=" * 50)
     
-    operations = [
-        ("Start VM", "POST", "/api/vm/start"),
-        ("Stop VM", "POST", "/api/vm/stop"),
-        ("Restart VM", "POST", "/api/vm/restart")
-    ]
-    
-    for name, method, endpoint in operations:
+    for name, method, url in OPERATIONS:
         print(f"\n🔧 {name}:")
-        print(f"   Endpoint: {method} http://127.0.0.1:5555{endpoint}")
+        print(f"   Endpoint: {method} {url}")
         print(f"   Expected Transitional State: 'Starting'/'Stopping'/'Restarting'")
         print(f"   Expected Color: Orange (Warning) with pulse animation")
 
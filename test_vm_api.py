@@ -6,14 +6,18 @@ Simple test script to verify VM API endpoints
 import requests
 import json
 
+BASE_URL = "http://127.0.0.1:5555"
+STATUS_URL = f"{BASE_URL}/api/vm/status"
+
+# One session keeps the connection to the local API alive between calls
+SESSION = requests.Session()
+
 def test_vm_api():
-    base_url = "http://127.0.0.1:5555"
-    
     # Test VM status endpoint
     try:
         print("Testing VM status endpoint...")
-        print(f"Connecting to: {base_url}/api/vm/status")
-        response = requests.get(f"{base_url}/api/vm/status", timeout=5)
+        print(f"Connecting to: {STATUS_URL}")
+        response = SESSION.get(STATUS_URL, timeout=5)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
@@ -6,13 +6,17 @@ Test script to check VM status and trigger VM section load
 import requests
 import json
 
+BASE_URL = "http://127.0.0.1:5555"
+STATUS_URL = f"{BASE_URL}/api/vm/status"
+
+# One session keeps the connection to the local API alive between calls
+SESSION = requests.Session()
+
 def test_vm_gui():
-    base_url = "http://127.0.0.1:5555"
-    
     # Test VM status endpoint
     try:
         print("Testing VM status endpoint...")
-        response = requests.get(f"{base_url}/api/vm/status", timeout=5)
+        response = SESSION.get(STATUS_URL, timeout=5)
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
@@ -3,6 +3,7 @@ Servin Runtime
 Flask API server for managing Servin containers, images, and volumes
 """
 
+import functools
 import os
 import sys
 import threading
@@ -10,14 +11,116 @@ import time
 import subprocess
 import json
 from flask import Flask, jsonify, request, render_template, send_from_directory
+from flask.json.provider import DefaultJSONProvider, JSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit, disconnect
 from servin_client import ServinClient, ServinError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, so every jsonify() skips the stdlib encoder"""
+    
+    def dumps(self, obj, **kwargs):
+        # Reuse Flask's fallback for types orjson doesn't know (Decimal, __html__, ...)
+        return orjson.dumps(obj, default=DefaultJSONProvider.default,
+                            option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class UJsonProvider(JSONProvider):
+    """JSON provider backed by ujson, for platforms without orjson wheels"""
+    
+    def dumps(self, obj, **kwargs):
+        return ujson.dumps(obj, ensure_ascii=False, default=DefaultJSONProvider.default)
+    
+    def loads(self, s, **kwargs):
+        return ujson.loads(s)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+elif ujson is not None:
+    # _dumps and _ndjson_lines go through app.json, so they pick this up too
+    app.json = UJsonProvider(app)
 app.config['SECRET_KEY'] = 'servin-gui-secret-key'
 CORS(app)  # Enable CORS for all routes
 
+def _dumps(obj):
+    """Serialize obj for a response body, straight to bytes when orjson is available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=orjson.OPT_NON_STR_KEYS)
+    return app.json.dumps(obj)
+
+def _json_body(body, status=200):
+    """Wrap an already serialized JSON body in a response"""
+    return app.response_class(body, status=status, mimetype='application/json')
+
+def _json(obj, status=200):
+    """Build a JSON response from obj"""
+    return _json_body(_dumps(obj), status)
+
+# Constant error bodies, serialized once at import
+RUNTIME_UNAVAILABLE = _dumps({'error': 'Servin runtime not available'})
+IMAGE_NAME_REQUIRED = _dumps({'error': 'Image name required'})
+VOLUME_NAME_REQUIRED = _dumps({'error': 'Volume name required'})
+
+def _ndjson_lines(lines):
+    """Encode each log line as one newline-delimited JSON record"""
+    for line in lines:
+        if orjson is not None:
+            yield orjson.dumps({'line': line}) + b'\n'
+        else:
+            yield app.json.dumps({'line': line}) + '\n'
+
+# Bodies of recently served polling endpoints: path -> (monotonic time, bytes)
+_cache = {}
+
+def cached(ttl):
+    """Serve a GET handler's last successful body for ttl seconds
+    
+    Bursts of polling from the webview collapse into one backend call. If a
+    refresh fails, the last good body is served instead of the error.
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(*args, **kwargs):
+            entry = _cache.get(request.path)
+            now = time.monotonic()
+            if entry and now - entry[0] < ttl:
+                return _json_body(entry[1])
+            
+            try:
+                response = app.make_response(handler(*args, **kwargs))
+            except ServinError:
+                if entry is None:
+                    raise
+                return _json_body(entry[1])
+            
+            if response.status_code == 200:
+                _cache[request.path] = (now, response.get_data())
+            elif entry is not None:
+                return _json_body(entry[1])
+            return response
+        return wrapper
+    return decorator
+
+@app.after_request
+def _invalidate_vm_status(response):
+    """Drop the cached VM status once a VM operation has run"""
+    if request.method == 'POST' and request.path.startswith('/api/vm/'):
+        _cache.pop('/api/vm/status', None)
+    return response
+
 # Configure SocketIO with explicit async mode for PyInstaller compatibility
 import sys
 
@@ -98,8 +201,15 @@ except Exception as e:
     # Create a minimal mock SocketIO for basic functionality
     class MockSocketIO:
         def emit(self, *args, **kwargs): pass
-        def on(self, *args, **kwargs): pass
-        def run(self, app, **kwargs): app.run(**kwargs)
+        def on(self, *args, **kwargs): return lambda handler: handler
+        def run(self, app, host='127.0.0.1', port=5555, **kwargs):
+            # Plain HTTP only, so a multi-threaded WSGI server can take over from Werkzeug
+            try:
+                from waitress import serve
+            except ImportError:
+                app.run(host=host, port=port, **kwargs)
+                return
+            serve(app, host=host, port=port, threads=8, connection_limit=200, _quiet=True)
     socketio = MockSocketIO()
 
 # Store active log streaming processes
@@ -118,6 +228,22 @@ except (ServinError, Exception) as e:
     print("Please ensure the servin binary is available and working properly")
     servin_client = None
 
+@app.errorhandler(ServinError)
+def _servin_error(e):
+    """Report runtime failures from any handler as a JSON 500"""
+    return _json({'error': str(e)}, 500)
+
+@app.errorhandler(400)
+def _bad_request(e):
+    """Keep malformed request bodies in the API's JSON error format"""
+    return _json({'error': e.description}, 400)
+
+@app.before_request
+def _require_client():
+    """Reject every API call up front when the runtime could not be reached"""
+    if servin_client is None and request.path.startswith('/api/'):
+        return _json_body(RUNTIME_UNAVAILABLE, 500)
+
 @app.route('/')
 def index():
     """Serve the main HTML page"""
@@ -134,95 +260,55 @@ def static_files(filename):
 @app.route('/api/containers', methods=['GET'])
 def get_containers():
     """Get list of all containers"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        containers = servin_client.list_containers()
-        return jsonify(containers)
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    containers = servin_client.list_containers()
+    return _json(containers)
 
 @app.route('/api/containers/<container_id>/start', methods=['POST'])
 def start_container(container_id):
     """Start a container"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        result = servin_client.start_container(container_id)
-        return jsonify(result)
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    result = servin_client.start_container(container_id)
+    return _json(result)
 
 @app.route('/api/containers/<container_id>/stop', methods=['POST'])
 def stop_container(container_id):
     """Stop a container"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        servin_client.stop_container(container_id)
-        return jsonify({'success': True, 'message': f'Container {container_id} stopped'})
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    servin_client.stop_container(container_id)
+    return _json({'success': True, 'message': f'Container {container_id} stopped'})
 
 @app.route('/api/containers/<container_id>/restart', methods=['POST'])
 def restart_container(container_id):
     """Restart a container"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        servin_client.restart_container(container_id)
-        return jsonify({'success': True, 'message': f'Container {container_id} restarted'})
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    servin_client.restart_container(container_id)
+    return _json({'success': True, 'message': f'Container {container_id} restarted'})
 
 @app.route('/api/containers/<container_id>/remove', methods=['DELETE'])
 def remove_container(container_id):
     """Remove a container"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        servin_client.remove_container(container_id, force=True)
-        return jsonify({'success': True, 'message': f'Container {container_id} removed'})
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    servin_client.remove_container(container_id, force=True)
+    return _json({'success': True, 'message': f'Container {container_id} removed'})
 
 @app.route('/api/containers/<container_id>/details', methods=['GET'])
 def get_container_details(container_id):
     """Get detailed information about a container"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        details = servin_client.inspect_container(container_id)
-        return jsonify(details)
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    details = servin_client.inspect_container(container_id)
+    return _json(details)
 
 @app.route('/api/containers/<container_id>/logs', methods=['GET'])
 def get_container_logs(container_id):
     """Get container logs"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
+    follow = request.args.get('follow', 'false').lower() == 'true'
+    tail = request.args.get('tail', '100')
+    if follow:
+        # Send lines as servin produces them instead of buffering the whole log
+        lines = servin_client.follow_logs(container_id, tail=int(tail))
+        return app.response_class(_ndjson_lines(lines), mimetype='application/x-ndjson')
     
-    try:
-        follow = request.args.get('follow', 'false').lower() == 'true'
-        tail = request.args.get('tail', '100')
-        logs = servin_client.get_logs(container_id, follow=follow, tail=int(tail))
-        return jsonify({'logs': logs})
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    logs = servin_client.get_logs(container_id, tail=int(tail))
+    return _json({'logs': logs})
 
 @app.route('/api/containers/<container_id>/files', methods=['GET'])
 def get_container_files(container_id):
     """Get container filesystem listing using exec"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
     try:
         path = request.args.get('path', '/')
         
@@ -244,7 +330,7 @@ def get_container_files(container_id):
                 continue
         
         if not result or not result.strip():
-            return jsonify([])
+            return _json([])
         
         # Parse the ls output to create file listing
         files = []
@@ -294,155 +380,99 @@ def get_container_files(container_id):
                     'path': path
                 })
         
-        return jsonify(files)
+        return _json(files)
         
     except Exception as e:
         print(f"Error listing files: {e}")
-        return jsonify({'error': f'Failed to list files: {str(e)}'}), 500
+        return _json({'error': f'Failed to list files: {str(e)}'}, 500)
 
 @app.route('/api/containers/<container_id>/exec', methods=['POST'])
 def exec_container_command(container_id):
     """Execute command in container"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        data = request.get_json()
-        command = data.get('command', 'sh')
-        interactive = data.get('interactive', True)
-        
-        if interactive:
-            # For interactive sessions, we'll simulate the response
-            # In a real implementation, this would use WebSockets
-            result = servin_client.exec_command(container_id, command)
-            return jsonify({'output': result, 'exit_code': 0})
-        else:
-            result = servin_client.exec_command(container_id, command)
-            return jsonify({'output': result, 'exit_code': 0})
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    data = request.get_json()
+    command = data.get('command', 'sh')
+    interactive = data.get('interactive', True)
+    
+    if interactive:
+        # For interactive sessions, we'll simulate the response
+        # In a real implementation, this would use WebSockets
+        result = servin_client.exec_command(container_id, command)
+        return _json({'output': result, 'exit_code': 0})
+    else:
+        result = servin_client.exec_command(container_id, command)
+        return _json({'output': result, 'exit_code': 0})
 
 @app.route('/api/containers/<container_id>/env', methods=['GET'])
 def get_container_environment(container_id):
     """Get container environment variables"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        env_vars = servin_client.get_environment(container_id)
-        return jsonify({'environment': env_vars})
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    env_vars = servin_client.get_environment(container_id)
+    return _json({'environment': env_vars})
 
 # Image Management APIs
 @app.route('/api/images', methods=['GET'])
 def get_images():
     """Get list of all images"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        images = servin_client.list_images()
-        return jsonify(images)
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    images = servin_client.list_images()
+    return _json(images)
 
 @app.route('/api/images/pull', methods=['POST'])
 def pull_image():
     """Pull an image from registry (import for servin)"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
     data = request.get_json()
     if not data or 'image' not in data:
-        return jsonify({'error': 'Image name required'}), 400
+        return _json_body(IMAGE_NAME_REQUIRED, 400)
     
-    try:
-        # For servin, we'll explain that pull is not supported
-        # Instead, users need to import images from tarballs
-        return jsonify({'error': 'Servin does not support pulling images from registries. Use image import with tarball files instead.'}), 400
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    # For servin, we'll explain that pull is not supported
+    # Instead, users need to import images from tarballs
+    return _json({'error': 'Servin does not support pulling images from registries. Use image import with tarball files instead.'}, 400)
 
 @app.route('/api/images/import', methods=['POST'])
 def import_image():
     """Import an image from tarball"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
     data = request.get_json()
     if not data or 'tarball' not in data or 'name' not in data:
-        return jsonify({'error': 'Tarball path and image name required'}), 400
+        return _json({'error': 'Tarball path and image name required'}, 400)
     
-    try:
-        tarball_path = data['tarball']
-        image_name = data['name']
-        servin_client.import_image(tarball_path, image_name)
-        return jsonify({'success': True, 'message': f'Image {image_name} imported successfully'})
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    tarball_path = data['tarball']
+    image_name = data['name']
+    servin_client.import_image(tarball_path, image_name)
+    return _json({'success': True, 'message': f'Image {image_name} imported successfully'})
 
 @app.route('/api/images/<image_id>/remove', methods=['DELETE'])
 def remove_image(image_id):
     """Remove an image"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        servin_client.remove_image(image_id, force=True)
-        return jsonify({'success': True, 'message': f'Image {image_id} removed'})
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    servin_client.remove_image(image_id, force=True)
+    return _json({'success': True, 'message': f'Image {image_id} removed'})
 
 # Volume Management APIs
 @app.route('/api/volumes', methods=['GET'])
 def get_volumes():
     """Get list of all volumes"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        volumes = servin_client.list_volumes()
-        return jsonify(volumes)
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    volumes = servin_client.list_volumes()
+    return _json(volumes)
 
 @app.route('/api/volumes/<volume_name>/remove', methods=['DELETE'])
 def remove_volume(volume_name):
     """Remove a volume"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        servin_client.remove_volume(volume_name)
-        return jsonify({'success': True, 'message': f'Volume {volume_name} removed'})
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    servin_client.remove_volume(volume_name)
+    return _json({'success': True, 'message': f'Volume {volume_name} removed'})
 
 @app.route('/api/volumes/create', methods=['POST'])
 def create_volume():
     """Create a new volume"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
     data = request.get_json()
     if not data or 'name' not in data:
-        return jsonify({'error': 'Volume name required'}), 400
+        return _json_body(VOLUME_NAME_REQUIRED, 400)
     
-    try:
-        volume_name = data['name']
-        servin_client.create_volume(volume_name)
-        return jsonify({'success': True, 'message': f'Volume {volume_name} created successfully'})
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    volume_name = data['name']
+    servin_client.create_volume(volume_name)
+    return _json({'success': True, 'message': f'Volume {volume_name} created successfully'})
 
 # VM Engine Management APIs
 @app.route('/api/vm/status', methods=['GET'])
+@cached(ttl=2.0)
 def get_vm_status():
     """Get VM engine status"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
     try:
         # Get the Servin root directory (parent of webview_gui)
         servin_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -500,9 +530,6 @@ def get_vm_status():
 @app.route('/api/vm/start', methods=['POST'])
 def start_vm():
     """Start the VM engine"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
     try:
         # Get the Servin root directory (parent of webview_gui)
         servin_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -524,9 +551,6 @@ def start_vm():
 @app.route('/api/vm/stop', methods=['POST'])
 def stop_vm():
     """Stop the VM engine"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
     try:
         # Get the Servin root directory (parent of webview_gui)
         servin_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -548,9 +572,6 @@ def stop_vm():
 @app.route('/api/vm/restart', methods=['POST'])
 def restart_vm():
     """Restart the VM engine"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
     try:
         # Get the Servin root directory (parent of webview_gui)
         servin_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -581,9 +602,6 @@ def restart_vm():
 @app.route('/api/vm/enable', methods=['POST'])
 def enable_vm():
     """Enable VM mode"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
     try:
         # Get the Servin root directory (parent of webview_gui)
         servin_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -605,9 +623,6 @@ def enable_vm():
 @app.route('/api/vm/disable', methods=['POST'])
 def disable_vm():
     """Disable VM mode"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
     try:
         # Get the Servin root directory (parent of webview_gui)
         servin_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -628,16 +643,11 @@ def disable_vm():
 
 # System Information APIs
 @app.route('/api/system/info', methods=['GET'])
+@cached(ttl=10.0)
 def get_system_info():
     """Get Servin system information"""
-    if not servin_client:
-        return jsonify({'error': 'Servin runtime not available'}), 500
-    
-    try:
-        info = servin_client.info()
-        return jsonify(info)
-    except ServinError as e:
-        return jsonify({'error': str(e)}), 500
+    info = servin_client.info()
+    return _json(info)
 
 # WebSocket Event Handlers for Real-time Features
 
@@ -7,7 +7,7 @@ import json
 import os
 import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
 class ServinError(Exception):
     """Exception raised for servin command errors"""
@@ -295,6 +295,10 @@ class MockServinClient:
         
         return '\n'.join(logs)
 
+    def follow_logs(self, container_id: str, tail: int = 100) -> Iterator[str]:
+        """Stream container logs line by line"""
+        yield from self.get_logs(container_id, tail=tail).split('\n')
+
     def list_files(self, container_id: str, path: str = '/') -> List[Dict[str, Any]]:
         """List files in container filesystem"""
         # Mock filesystem structure with proper path handling
@@ -8,8 +8,14 @@ import subprocess
 import os
 import time
 import platform
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+
+@lru_cache(maxsize=1)
+def detect_platform():
+    """Return the host's (system, machine), lowercased; it never changes within a process"""
+    return platform.system().lower(), platform.machine().lower()
 
 class ServinError(Exception):
     """Exception raised for servin command errors"""
@@ -35,8 +41,6 @@ class ServinClient:
         """
         Find the appropriate servin binary for the current platform
         """
-        import platform
-        
         current_dir = os.path.dirname(os.path.abspath(__file__))
         parent_dir = os.path.dirname(current_dir)
         
@@ -44,8 +48,7 @@ class ServinClient:
         search_paths = []
         
         # First, try platform-specific build directories
-        system = platform.system().lower()
-        machine = platform.machine().lower()
+        system, machine = detect_platform()
         
         if system == "windows":
             # Windows-specific paths
@@ -119,6 +122,13 @@ class ServinClient:
         except FileNotFoundError:
             raise ServinError(f"Servin binary not found: {self.servin_path}")
     
+    def _build_command(self, args: List[str]) -> List[str]:
+        """Build the servin command line for args"""
+        # On macOS, use development mode to skip root check for container operations
+        if detect_platform()[0] == "darwin" and args[0] != "--help":
+            return [self.servin_path, "--dev"] + args
+        return [self.servin_path] + args
+    
     def _run_command(self, args: List[str], check_output: bool = True) -> subprocess.CompletedProcess:
         """
         Run a servin command
@@ -130,13 +140,7 @@ class ServinClient:
         Returns:
             subprocess.CompletedProcess object
         """
-        import platform
-        
-        # On macOS, use development mode to skip root check for container operations
-        if platform.system() == "Darwin" and args[0] != "--help":
-            cmd = [self.servin_path, "--dev"] + args
-        else:
-            cmd = [self.servin_path] + args
+        cmd = self._build_command(args)
         
         try:
             result = subprocess.run(cmd, capture_output=check_output, text=True, timeout=30)
@@ -888,6 +892,40 @@ class ServinClient:
             # Fallback message for any other errors
             return f"Container {container_id[:12]} logs unavailable.\nReason: {str(e)}\nNote: Running on macOS with limited containerization support."
     
+    def follow_logs(self, container_id: str, tail: int = 100) -> Iterator[str]:
+        """
+        Stream container logs line by line as they are written
+        
+        Args:
+            container_id: Container ID or name
+            tail: Number of existing lines to start from
+            
+        Returns:
+            Iterator over log lines without the trailing newline
+        """
+        args = ["logs", "-f", container_id]
+        if tail > 0:
+            args.extend(["--tail", str(tail)])
+        
+        # Spawn now, not on first next(), so a failure surfaces before any
+        # response has been started
+        try:
+            process = subprocess.Popen(self._build_command(args), stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, text=True, bufsize=1)
+        except OSError as e:
+            raise ServinError(f"Failed to execute command: {e}")
+        
+        def lines():
+            # Closing the generator (client went away) stops the servin process
+            try:
+                for line in process.stdout:
+                    yield line.rstrip('\n')
+            finally:
+                process.terminate()
+                process.wait()
+        
+        return lines()
+    
     def list_files(self, container_id: str, path: str = '/') -> List[Dict[str, Any]]:
         """
         List files in container filesystem
@@ -1010,29 +1048,33 @@ class ServinClient:
         Returns:
             List of files and directories
         """
+        import stat as stat_module
+        
         files = []
         
         try:
-            for item in os.listdir(host_path):
-                item_path = os.path.join(host_path, item)
-                
-                # Get file stats
-                stat = os.stat(item_path)
-                is_directory = os.path.isdir(item_path)
-                
-                # Convert mode to permission string
-                import stat as stat_module
-                mode = stat.st_mode
-                permissions = stat_module.filemode(mode)
-                
-                files.append({
-                    'name': item,
-                    'type': 'directory' if is_directory else 'file',
-                    'size': stat.st_size,
-                    'permissions': permissions,
-                    'is_directory': is_directory,
-                    'path': f"{container_path.rstrip('/')}/{item}" if container_path != '/' else f"/{item}"
-                })
+            # scandir hands back names and paths from one directory read, so
+            # each entry costs a single stat
+            with os.scandir(host_path) as entries:
+                for entry in entries:
+                    item = entry.name
+                    
+                    # Get file stats
+                    stat = entry.stat()
+                    mode = stat.st_mode
+                    is_directory = stat_module.S_ISDIR(mode)
+                    
+                    # Convert mode to permission string
+                    permissions = stat_module.filemode(mode)
+                    
+                    files.append({
+                        'name': item,
+                        'type': 'directory' if is_directory else 'file',
+                        'size': stat.st_size,
+                        'permissions': permissions,
+                        'is_directory': is_directory,
+                        'path': f"{container_path.rstrip('/')}/{item}" if container_path != '/' else f"/{item}"
+                    })
                 
         except Exception as e:
             raise ServinError(f"Failed to list host directory {host_path}: {e}")